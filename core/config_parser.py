@@ -1,13 +1,19 @@
 import re
 import os
+import mmap
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
+from collections import OrderedDict
 import ipaddress
 
 @dataclass
 class ParsedInterface:
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('name', 'ip_address', 'subnet_mask', 'bandwidth', 'mtu', 'vlan',
+                 'description', 'shutdown', 'encapsulation')
+    
     name: str
     ip_address: str
     subnet_mask: str
@@ -20,6 +26,9 @@ class ParsedInterface:
 
 @dataclass
 class ParsedConfig:
+    __slots__ = ('hostname', 'interfaces', 'routing_protocols', 'vlans', 'ospf_areas', 'bgp_asn',
+                 'default_gateway', 'dns_servers', 'ntp_servers', 'access_lists', 'route_maps')
+    
     hostname: str
     interfaces: List[ParsedInterface]
     routing_protocols: List[str]
@@ -32,125 +41,166 @@ class ParsedConfig:
     access_lists: Dict[str, List[str]]
     route_maps: Dict[str, List[str]]
 
+# Common Cisco IOS patterns, compiled once at import time. They are bytes patterns
+# so they can run directly over a memory-mapped file without decoding it first,
+# and \d/\s only ever match ASCII. IPv4 addresses use bounded octet repeats.
+# Interface section headers; splitting on these yields (name, block) pairs in linear time
+_INTERFACE_HEADER_RE = re.compile(rb'^[ \t]*interface[ \t]+(\S+)[^\n]*$', re.MULTILINE)
+
+# Interface-level settings, matched together in a single pass over each block.
+# "no shutdown" is listed first so it is never mistaken for a bare "shutdown".
+_INTERFACE_FIELD_RE = re.compile(
+    rb'(?P<ip>ip\s+address\s+(?P<ip_address>(?:\d{1,3}\.){3}\d{1,3})\s+(?P<subnet_mask>(?:\d{1,3}\.){3}\d{1,3}))'
+    rb'|(?P<description>description\s+(?P<description_value>[^\r\n]+))'
+    rb'|(?P<no_shutdown>no\s+shutdown\b)'
+    rb'|(?P<shutdown>shutdown\b)'
+    rb'|(?P<bandwidth>bandwidth\s+(?P<bandwidth_value>\d+))'
+    rb'|(?P<mtu>mtu\s+(?P<mtu_value>\d+))'
+    rb'|(?P<vlan>switchport\s+access\s+vlan\s+(?P<vlan_id>\d+))'
+    rb'|(?P<encapsulation>encapsulation\s+(?P<encapsulation_value>\S+))'
+)
+
+# Device-wide directives, matched together in a single pass over the file.
+# Each alternative is an outer named group so match.lastgroup names the token.
+_GLOBAL_DIRECTIVE_RE = re.compile(
+    rb'(?P<hostname>hostname\s+(?P<hostname_value>\S+))'
+    rb'|(?P<ospf>router\s+ospf\s+\d+)'
+    rb'|(?P<bgp>router\s+bgp\s+(?P<bgp_asn>\d+))'
+    rb'|(?P<eigrp>router\s+eigrp)'
+    rb'|(?P<rip>router\s+rip)'
+    rb'|(?P<ospf_area>network\s+(?:\d{1,3}\.){3}\d{1,3}\s+(?:\d{1,3}\.){3}\d{1,3}\s+area\s+(?P<area>\S+))'
+    rb'|(?P<default_gateway>ip\s+route\s+0\.0\.0\.0\s+0\.0\.0\.0\s+(?P<gateway>(?:\d{1,3}\.){3}\d{1,3}))'
+    rb'|(?P<dns_server>ip\s+name-server\s+(?P<dns>(?:\d{1,3}\.){3}\d{1,3}))'
+    rb'|(?P<ntp_server>ntp\s+server\s+(?P<ntp>(?:\d{1,3}\.){3}\d{1,3}))'
+    rb'|(?P<access_list>access-list\s+(?P<acl_id>\d+)\s+(?P<acl_entry>[^\r\n]+))'
+    rb'|(?P<route_map>route-map\s+(?P<rm_name>\S+)\s+(?P<rm_entry>[^\r\n]+))'
+    rb'|(?P<vlan>vlan\s+(?P<vlan_id>\d+))'
+)
+
+# Order in which detected routing protocols are reported
+_ROUTING_PROTOCOL_ORDER = ('OSPF', 'BGP', 'EIGRP', 'RIP')
+
+# Maximum number of parsed files remembered by a single parser
+_PARSE_CACHE_SIZE = 1024
+
+# Files at least this large are memory-mapped instead of read into memory
+_MMAP_THRESHOLD = 1024 * 1024
+
+def _text(value: bytes) -> str:
+    """Decode a captured token, ignoring bytes that are not valid UTF-8"""
+    return value.decode('utf-8', 'ignore')
+
 class ConfigParser:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Common Cisco IOS patterns
-        self.patterns = {
-            'hostname': r'hostname\s+(\S+)',
-            'interface': r'interface\s+(\S+)',
-            'ip_address': r'ip\s+address\s+(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)',
-            'description': r'description\s+(.+)',
-            'shutdown': r'shutdown',
-            'no_shutdown': r'no\s+shutdown',
-            'bandwidth': r'bandwidth\s+(\d+)',
-            'mtu': r'mtu\s+(\d+)',
-            'vlan': r'switchport\s+access\s+vlan\s+(\d+)',
-            'encapsulation': r'encapsulation\s+(\S+)',
-            'ospf': r'router\s+ospf\s+(\d+)',
-            'bgp': r'router\s+bgp\s+(\d+)',
-            'default_gateway': r'ip\s+route\s+0\.0\.0\.0\s+0\.0\.0\.0\s+(\d+\.\d+\.\d+\.\d+)',
-            'dns_server': r'ip\s+name-server\s+(\d+\.\d+\.\d+\.\d+)',
-            'ntp_server': r'ntp\s+server\s+(\d+\.\d+\.\d+\.\d+)',
-            'access_list': r'access-list\s+(\d+)\s+(.+)',
-            'route_map': r'route-map\s+(\S+)\s+(.+)'
-        }
+        # Parsed configs keyed by (absolute path, mtime, size), least recently used first
+        self._parse_cache: "OrderedDict[Tuple[str, int, int], ParsedConfig]" = OrderedDict()
     
     def parse_config_file(self, file_path: str) -> ParsedConfig:
-        """Parse a router configuration file"""
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
+        """Parse a router configuration file
+        
+        Results are cached per file and reused until the file's modification
+        time or size changes, so callers must not mutate the returned config.
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}") from None
+        
+        cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            self._parse_cache.move_to_end(cache_key)
+            self.logger.debug(f"Using cached configuration for {file_path}")
+            return cached
         
         self.logger.info(f"Parsing configuration file: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        # Content stays bytes and only captured tokens are decoded. Large files are
+        # mapped rather than read; small ones are cheaper to read in one call.
+        with open(file_path, 'rb') as f:
+            if stat.st_size >= _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    interfaces, settings = self._parse_content(content)
+            else:
+                interfaces, settings = self._parse_content(f.read())
         
-        # Extract basic information
-        hostname = self._extract_hostname(content)
-        interfaces = self._extract_interfaces(content)
-        routing_protocols = self._extract_routing_protocols(content)
-        vlans = self._extract_vlans(content)
-        ospf_areas = self._extract_ospf_areas(content)
-        bgp_asn = self._extract_bgp_asn(content)
-        default_gateway = self._extract_default_gateway(content)
-        dns_servers = self._extract_dns_servers(content)
-        ntp_servers = self._extract_ntp_servers(content)
-        access_lists = self._extract_access_lists(content)
-        route_maps = self._extract_route_maps(content)
+        config = ParsedConfig(interfaces=interfaces, **settings)
+        
+        self._parse_cache[cache_key] = config
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
         
-        return ParsedConfig(
-            hostname=hostname,
-            interfaces=interfaces,
-            routing_protocols=routing_protocols,
-            vlans=vlans,
-            ospf_areas=ospf_areas,
-            bgp_asn=bgp_asn,
-            default_gateway=default_gateway,
-            dns_servers=dns_servers,
-            ntp_servers=ntp_servers,
-            access_lists=access_lists,
-            route_maps=route_maps
-        )
+        return config
+    
+    def parse_config_text(self, content: Union[str, bytes]) -> ParsedConfig:
+        """Parse configuration text that is already in memory"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        interfaces, settings = self._parse_content(content)
+        return ParsedConfig(interfaces=interfaces, **settings)
     
-    def _extract_hostname(self, content: str) -> str:
-        """Extract hostname from configuration"""
-        match = re.search(self.patterns['hostname'], content)
-        if match:
-            return match.group(1)
-        return "unknown"
+    def _parse_content(self, content: bytes) -> Tuple[List[ParsedInterface], Dict[str, Any]]:
+        """Parse raw configuration bytes into interfaces and device-wide settings"""
+        # Interfaces are block-scoped; everything else comes from one pass
+        interfaces = self._extract_interfaces(content)
+        settings = self._extract_global_settings(content)
+        return interfaces, settings
     
-    def _extract_interfaces(self, content: str) -> List[ParsedInterface]:
+    def _extract_interfaces(self, content: bytes) -> List[ParsedInterface]:
         """Extract interface configurations"""
         interfaces = []
         
-        # Find all interface blocks
-        interface_blocks = re.findall(
-            r'interface\s+(\S+)(.*?)(?=interface|\Z)', 
-            content, 
-            re.DOTALL
-        )
+        # Split into interface sections; each block runs up to the next header or EOF
+        parts = _INTERFACE_HEADER_RE.split(content)
         
-        for interface_name, interface_config in interface_blocks:
+        for raw_name, interface_config in zip(parts[1::2], parts[2::2]):
+            interface_name = _text(raw_name)
             try:
-                # Extract IP address and subnet mask
-                ip_match = re.search(self.patterns['ip_address'], interface_config)
                 ip_address = ""
                 subnet_mask = ""
-                if ip_match:
-                    ip_address = ip_match.group(1)
-                    subnet_mask = ip_match.group(2)
-                
-                # Extract description
-                desc_match = re.search(self.patterns['description'], interface_config)
-                description = desc_match.group(1) if desc_match else ""
-                
-                # Check if interface is shutdown
-                shutdown = bool(re.search(self.patterns['shutdown'], interface_config))
-                
-                # Extract bandwidth
-                bw_match = re.search(self.patterns['bandwidth'], interface_config)
-                bandwidth = int(bw_match.group(1)) if bw_match else 100
+                description = ""
+                shutdown = False
+                bandwidth = None
+                mtu = None
+                vlan = None
+                encapsulation = None
                 
-                # Extract MTU
-                mtu_match = re.search(self.patterns['mtu'], interface_config)
-                mtu = int(mtu_match.group(1)) if mtu_match else 1500
-                
-                # Extract VLAN
-                vlan_match = re.search(self.patterns['vlan'], interface_config)
-                vlan = int(vlan_match.group(1)) if vlan_match else None
-                
-                # Extract encapsulation
-                encap_match = re.search(self.patterns['encapsulation'], interface_config)
-                encapsulation = encap_match.group(1) if encap_match else None
+                # First occurrence of each setting wins; the last shutdown/no shutdown wins
+                for match in _INTERFACE_FIELD_RE.finditer(interface_config):
+                    kind = match.lastgroup
+                    
+                    if kind == 'ip':
+                        if not ip_address:
+                            ip_address = _text(match.group('ip_address'))
+                            subnet_mask = _text(match.group('subnet_mask'))
+                    elif kind == 'description':
+                        if not description:
+                            description = _text(match.group('description_value'))
+                    elif kind == 'no_shutdown':
+                        shutdown = False
+                    elif kind == 'shutdown':
+                        shutdown = True
+                    elif kind == 'bandwidth':
+                        if bandwidth is None:
+                            bandwidth = int(match.group('bandwidth_value'))
+                    elif kind == 'mtu':
+                        if mtu is None:
+                            mtu = int(match.group('mtu_value'))
+                    elif kind == 'vlan':
+                        if vlan is None:
+                            vlan = int(match.group('vlan_id'))
+                    elif kind == 'encapsulation':
+                        if encapsulation is None:
+                            encapsulation = _text(match.group('encapsulation_value'))
                 
                 interface = ParsedInterface(
                     name=interface_name,
                     ip_address=ip_address,
                     subnet_mask=subnet_mask,
-                    bandwidth=bandwidth,
-                    mtu=mtu,
+                    bandwidth=bandwidth if bandwidth is not None else 100,
+                    mtu=mtu if mtu is not None else 1500,
                     vlan=vlan,
                     description=description,
                     shutdown=shutdown,
@@ -165,133 +215,95 @@ class ConfigParser:
         
         return interfaces
     
-    def _extract_routing_protocols(self, content: str) -> List[str]:
-        """Extract routing protocols from configuration"""
-        protocols = []
-        
-        # Check for OSPF
-        if re.search(self.patterns['ospf'], content):
-            protocols.append('OSPF')
-        
-        # Check for BGP
-        if re.search(self.patterns['bgp'], content):
-            protocols.append('BGP')
-        
-        # Check for EIGRP (basic check)
-        if re.search(r'router\s+eigrp', content):
-            protocols.append('EIGRP')
-        
-        # Check for RIP (basic check)
-        if re.search(r'router\s+rip', content):
-            protocols.append('RIP')
-        
-        return protocols
-    
-    def _extract_vlans(self, content: str) -> List[int]:
-        """Extract VLAN configurations"""
-        vlans = []
-        
-        # Find VLAN definitions
-        vlan_matches = re.findall(r'vlan\s+(\d+)', content)
-        for vlan_match in vlan_matches:
-            try:
-                vlans.append(int(vlan_match))
-            except ValueError:
-                continue
-        
-        return list(set(vlans))  # Remove duplicates
-    
-    def _extract_ospf_areas(self, content: str) -> List[str]:
-        """Extract OSPF area information"""
-        areas = []
-        
-        # Find OSPF area assignments
-        area_matches = re.findall(r'network\s+\d+\.\d+\.\d+\.\d+\s+\d+\.\d+\.\d+\.\d+\s+area\s+(\S+)', content)
-        for area_match in area_matches:
-            areas.append(area_match)
-        
-        return list(set(areas))
-    
-    def _extract_bgp_asn(self, content: str) -> Optional[int]:
-        """Extract BGP ASN"""
-        match = re.search(self.patterns['bgp'], content)
-        if match:
-            try:
-                return int(match.group(1))
-            except ValueError:
-                pass
-        return None
-    
-    def _extract_default_gateway(self, content: str) -> Optional[str]:
-        """Extract default gateway"""
-        match = re.search(self.patterns['default_gateway'], content)
-        if match:
-            return match.group(1)
-        return None
-    
-    def _extract_dns_servers(self, content: str) -> List[str]:
-        """Extract DNS servers"""
-        servers = []
-        matches = re.findall(self.patterns['dns_server'], content)
-        for match in matches:
-            servers.append(match)
-        return servers
-    
-    def _extract_ntp_servers(self, content: str) -> List[str]:
-        """Extract NTP servers"""
-        servers = []
-        matches = re.findall(self.patterns['ntp_server'], content)
-        for match in matches:
-            servers.append(match)
-        return servers
-    
-    def _extract_access_lists(self, content: str) -> Dict[str, List[str]]:
-        """Extract access lists"""
+    def _extract_global_settings(self, content: bytes) -> Dict[str, Any]:
+        """Extract all device-wide settings in a single scan of the configuration"""
+        hostname = None
+        protocols = set()
+        # Dicts used as insertion-ordered sets for first-seen de-duplication
+        vlans = {}
+        ospf_areas = {}
+        bgp_asn = None
+        default_gateway = None
+        dns_servers = []
+        ntp_servers = []
         access_lists = {}
-        
-        # Find access-list definitions
-        acl_matches = re.findall(r'access-list\s+(\d+)\s+(.+)', content)
-        for acl_id, acl_content in acl_matches:
-            if acl_id not in access_lists:
-                access_lists[acl_id] = []
-            access_lists[acl_id].append(acl_content.strip())
-        
-        return access_lists
-    
-    def _extract_route_maps(self, content: str) -> Dict[str, List[str]]:
-        """Extract route maps"""
         route_maps = {}
         
-        # Find route-map definitions
-        rm_matches = re.findall(r'route-map\s+(\S+)\s+(.+)', content)
-        for rm_name, rm_content in rm_matches:
-            if rm_name not in route_maps:
-                route_maps[rm_name] = []
-            route_maps[rm_name].append(rm_content.strip())
-        
-        return route_maps
+        for match in _GLOBAL_DIRECTIVE_RE.finditer(content):
+            kind = match.lastgroup
+            
+            if kind == 'hostname':
+                if hostname is None:
+                    hostname = _text(match.group('hostname_value'))
+            elif kind == 'ospf':
+                protocols.add('OSPF')
+            elif kind == 'bgp':
+                protocols.add('BGP')
+                if bgp_asn is None:
+                    bgp_asn = int(match.group('bgp_asn'))
+            elif kind == 'eigrp':
+                protocols.add('EIGRP')
+            elif kind == 'rip':
+                protocols.add('RIP')
+            elif kind == 'ospf_area':
+                ospf_areas[_text(match.group('area'))] = None
+            elif kind == 'default_gateway':
+                if default_gateway is None:
+                    default_gateway = _text(match.group('gateway'))
+            elif kind == 'dns_server':
+                dns_servers.append(_text(match.group('dns')))
+            elif kind == 'ntp_server':
+                ntp_servers.append(_text(match.group('ntp')))
+            elif kind == 'access_list':
+                access_lists.setdefault(_text(match.group('acl_id')), []).append(
+                    _text(match.group('acl_entry')).strip()
+                )
+            elif kind == 'route_map':
+                route_maps.setdefault(_text(match.group('rm_name')), []).append(
+                    _text(match.group('rm_entry')).strip()
+                )
+            elif kind == 'vlan':
+                vlans[int(match.group('vlan_id'))] = None
+        
+        return {
+            'hostname': hostname or "unknown",
+            'routing_protocols': [p for p in _ROUTING_PROTOCOL_ORDER if p in protocols],
+            'vlans': list(vlans),
+            'ospf_areas': list(ospf_areas),
+            'bgp_asn': bgp_asn,
+            'default_gateway': default_gateway,
+            'dns_servers': dns_servers,
+            'ntp_servers': ntp_servers,
+            'access_lists': access_lists,
+            'route_maps': route_maps
+        }
     
     def validate_config(self, config: ParsedConfig) -> List[str]:
         """Validate parsed configuration for common issues"""
         issues = []
         
-        # Check for duplicate IP addresses
+        # Single pass over interfaces: duplicate IPs, MTU groups and undefined VLANs
         ip_addresses = {}
+        mtu_groups: Dict[int, List[str]] = {}
+        defined_vlans = set(config.vlans)
+        vlan_issues = []
         for interface in config.interfaces:
             if interface.ip_address:
                 if interface.ip_address in ip_addresses:
                     issues.append(f"Duplicate IP address {interface.ip_address} on interfaces {ip_addresses[interface.ip_address]} and {interface.name}")
                 else:
                     ip_addresses[interface.ip_address] = interface.name
-        
-        # Check for MTU mismatches
-        mtu_values = {}
-        for interface in config.interfaces:
+            
             if interface.mtu:
-                if interface.mtu in mtu_values:
-                    issues.append(f"MTU mismatch: {interface.name} and {mtu_values[interface.mtu]} have same MTU {interface.mtu}")
-                else:
-                    mtu_values[interface.mtu] = interface.name
+                mtu_groups.setdefault(interface.mtu, []).append(interface.name)
+            
+            if interface.vlan and interface.vlan not in defined_vlans:
+                vlan_issues.append(f"Interface {interface.name} configured for VLAN {interface.vlan} but VLAN not defined")
+        
+        # Check for MTU mismatches (interfaces using different MTU values)
+        if len(mtu_groups) > 1:
+            groups = "; ".join(f"{mtu}: {', '.join(names)}" for mtu, names in mtu_groups.items())
+            issues.append(f"MTU mismatch across interfaces: {groups}")
         
         # Check for missing default gateway
         if not config.default_gateway:
@@ -302,9 +314,7 @@ class ConfigParser:
             issues.append("Both OSPF and BGP configured - potential routing conflicts")
         
         # Check for VLAN configuration issues
-        for interface in config.interfaces:
-            if interface.vlan and interface.vlan not in config.vlans:
-                issues.append(f"Interface {interface.name} configured for VLAN {interface.vlan} but VLAN not defined")
+        issues.extend(vlan_issues)
         
         return issues
     
@@ -337,8 +347,10 @@ class ConfigParser:
             'route_maps': config.route_maps
         }
         
+        # Encode in memory and write once; json.dump with indent issues a write per token
+        data = json.dumps(config_dict, indent=2)
         with open(output_file, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+            f.write(data)
         
         self.logger.info(f"Configuration exported to {output_file}")
 
@@ -375,13 +387,9 @@ if __name__ == "__main__":
     ip route 0.0.0.0 0.0.0.0 192.168.1.254
     """
     
-    # Write sample config to file for testing
-    with open('sample_config.txt', 'w') as f:
-        f.write(sample_config)
-    
     try:
-        # Parse the configuration
-        config = parser.parse_config_file('sample_config.txt')
+        # Parse the configuration straight from memory
+        config = parser.parse_config_text(sample_config)
         
         # Print parsed information
         print(f"Hostname: {config.hostname}")
@@ -406,7 +414,4 @@ if __name__ == "__main__":
         
     except Exception as e:
         print(f"Error: {e}")
-    
-    # Clean up test file
-    if os.path.exists('sample_config.txt'):
-        os.remove('sample_config.txt') 
\ No newline at end of file
+ 
\ No newline at end of file
@@ -1,56 +1,137 @@
+import asyncio
+import collections
+import concurrent.futures
+import heapq
 import threading
 import time
-import queue
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from enum import Enum
+from typing import Dict, List, Optional, Any, Set, Tuple, Callable, Iterable
+from dataclasses import dataclass, asdict
+from enum import IntEnum
 import ipaddress
 
-class DeviceType(Enum):
-    ROUTER = "router"
-    SWITCH = "switch"
-    ENDPOINT = "endpoint"
+# Integer-valued so hot-path state checks are plain int comparisons;
+# serialized as the lowercase member name
+class DeviceType(IntEnum):
+    ROUTER = 1
+    SWITCH = 2
+    ENDPOINT = 3
 
-class InterfaceState(Enum):
-    UP = "up"
-    DOWN = "down"
-    ADMIN_DOWN = "admin_down"
+class InterfaceState(IntEnum):
+    DOWN = 0
+    UP = 1
+    ADMIN_DOWN = 2
 
-@dataclass
+@dataclass(init=False)
 class Interface:
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10.
+    # Slotted fields cannot have class-level defaults, so __init__ is written out.
+    __slots__ = ('name', 'ip_address', 'subnet_mask', 'bandwidth', 'mtu', 'state', 'vlan',
+                 'description', '_network_int', '_netmask_int', 'mac_string')
+    
     name: str
     ip_address: str
     subnet_mask: str
     bandwidth: int  # in Mbps
     mtu: int
     state: InterfaceState
-    vlan: Optional[int] = None
-    description: str = ""
+    vlan: Optional[int]
+    description: str
+    
+    def __init__(self, name: str, ip_address: str, subnet_mask: str, bandwidth: int, mtu: int,
+                 state: InterfaceState, vlan: Optional[int] = None, description: str = ""):
+        self.name = name
+        self.ip_address = ip_address
+        self.subnet_mask = subnet_mask
+        self.bandwidth = bandwidth
+        self.mtu = mtu
+        self.state = state
+        self.vlan = vlan
+        self.description = description
+        # Simulated MAC, formatted once by the owning device
+        self.mac_string = ""
+        
+        # Interface network as integers for fast containment checks; None if unaddressed
+        self._network_int = None
+        self._netmask_int = 0
+        try:
+            network = ipaddress.IPv4Network(f"{ip_address}/{subnet_mask}", strict=False)
+        except ValueError:
+            return
+        self._network_int = int(network.network_address)
+        self._netmask_int = int(network.netmask)
+
+@dataclass
+class _DeviceStats:
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('packets_sent', 'packets_received', 'errors', 'uptime')
+    
+    packets_sent: int
+    packets_received: int
+    errors: int
+    uptime: float
+
+# Seconds between runs of each periodic task
+_UPTIME_INTERVAL = 1.0
+_KEEPALIVE_INTERVAL = 10.0
+_OSPF_HELLO_INTERVAL = 10.0
+
+# All devices are coroutines multiplexed on one event loop running in a single thread
+_device_loop: Optional[asyncio.AbstractEventLoop] = None
+_device_loop_lock = threading.Lock()
 
-class NetworkDevice(threading.Thread):
+def _get_device_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop shared by all devices, starting it on first use"""
+    global _device_loop
+    with _device_loop_lock:
+        if _device_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="device-loop", daemon=True).start()
+            _device_loop = loop
+        return _device_loop
+
+class NetworkDevice:
     def __init__(self, hostname: str, device_type: DeviceType, config: Dict[str, Any]):
-        super().__init__()
         self.hostname = hostname
         self.device_type = device_type
         self.config = config
-        self.message_queue = queue.Queue()
+        # Mailbox: any thread appends, the device coroutine drains. The event is only
+        # signalled (across threads) when the device is idle waiting for mail.
+        self.message_queue: collections.deque = collections.deque()
+        # Created inside run(): before Python 3.10 an asyncio.Event binds to the event
+        # loop current at construction, which is not the device loop
+        self._wake: Optional[asyncio.Event] = None
+        self._idle = False
         self.running = True
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._future: Optional[concurrent.futures.Future] = None
         self.interfaces: Dict[str, Interface] = {}
-        self.neighbors: List[str] = []
+        self.neighbors: Set[str] = set()
         self.routing_table: Dict[str, str] = {}
         self.arp_table: Dict[str, str] = {}
-        self.statistics = {
-            'packets_sent': 0,
-            'packets_received': 0,
-            'errors': 0,
-            'uptime': 0
-        }
+        self.statistics = _DeviceStats(packets_sent=0, packets_received=0, errors=0, uptime=0)
         
         # Setup logging
         self.logger = logging.getLogger(f"device.{hostname}")
         self.logger.setLevel(logging.INFO)
         
+        # Message type -> handler, bound once per device
+        self._handlers = {
+            'arp_request': self._handle_arp_request,
+            'ospf_hello': self._handle_ospf_hello,
+            'routing_update': self._handle_routing_update,
+            'ping': self._handle_ping
+        }
+        
+        # Periodic task name -> (interval, task); due times live in a heap while running
+        self._periodic_tasks: Dict[str, Tuple[float, Callable[[], None]]] = {
+            'uptime': (_UPTIME_INTERVAL, self._update_uptime),
+            'keepalive': (_KEEPALIVE_INTERVAL, self._send_keepalives)
+        }
+        if device_type is DeviceType.ROUTER:
+            self._periodic_tasks['ospf_hello'] = (_OSPF_HELLO_INTERVAL, self._send_ospf_hello)
+        self._schedule: List[Tuple[float, str]] = []
+        
         # Initialize interfaces from config
         self._initialize_interfaces()
         
@@ -67,39 +148,58 @@ class NetworkDevice(threading.Thread):
                 vlan=interface_data.get('vlan'),
                 description=interface_data.get('description', '')
             )
+            interface.mac_string = f"MAC_{self.hostname}_{interface.name}"
             self.interfaces[interface.name] = interface
     
     def add_neighbor(self, neighbor_hostname: str):
         """Add a neighbor device"""
         if neighbor_hostname not in self.neighbors:
-            self.neighbors.append(neighbor_hostname)
+            self.neighbors.add(neighbor_hostname)
             self.logger.info(f"Added neighbor: {neighbor_hostname}")
     
     def remove_neighbor(self, neighbor_hostname: str):
         """Remove a neighbor device"""
         if neighbor_hostname in self.neighbors:
-            self.neighbors.remove(neighbor_hostname)
+            self.neighbors.discard(neighbor_hostname)
             self.logger.info(f"Removed neighbor: {neighbor_hostname}")
     
+    def add_neighbors(self, neighbor_hostnames: Iterable[str]):
+        """Add several neighbor devices at once"""
+        added = [h for h in neighbor_hostnames if h not in self.neighbors]
+        if added:
+            self.neighbors.update(added)
+            self.logger.info(f"Added neighbors: {', '.join(added)}")
+    
+    def clear_neighbors(self) -> List[str]:
+        """Remove all neighbors and return the ones that were removed"""
+        removed = list(self.neighbors)
+        self.neighbors.clear()
+        if removed:
+            self.logger.info(f"Removed neighbors: {', '.join(removed)}")
+        return removed
+    
     def send_message(self, message: Dict[str, Any]):
         """Send a message to this device"""
-        self.message_queue.put(message)
+        self.message_queue.append(message)
+        if self._idle:
+            self._loop.call_soon_threadsafe(self._wake.set)
+    
+    def send_messages(self, messages: Iterable[Dict[str, Any]]):
+        """Send several messages to this device with a single wake-up"""
+        self.message_queue.extend(messages)
+        if self._idle:
+            self._loop.call_soon_threadsafe(self._wake.set)
     
     def process_message(self, message: Dict[str, Any]):
         """Process incoming messages"""
         msg_type = message.get('type')
-        self.statistics['packets_received'] += 1
+        self.statistics.packets_received += 1
         
-        if msg_type == 'arp_request':
-            self._handle_arp_request(message)
-        elif msg_type == 'ospf_hello':
-            self._handle_ospf_hello(message)
-        elif msg_type == 'routing_update':
-            self._handle_routing_update(message)
-        elif msg_type == 'ping':
-            self._handle_ping(message)
+        handler = self._handlers.get(msg_type)
+        if handler is not None:
+            handler(message)
         else:
-            self.logger.warning(f"Unknown message type: {msg_type}")
+            self.logger.warning("Unknown message type: %s", msg_type)
     
     def _handle_arp_request(self, message: Dict[str, Any]):
         """Handle ARP requests"""
@@ -114,9 +214,9 @@ class NetworkDevice(threading.Thread):
                     'type': 'arp_reply',
                     'target_mac': source_mac,
                     'source_ip': target_ip,
-                    'source_mac': f"MAC_{self.hostname}_{interface.name}"
+                    'source_mac': interface.mac_string
                 }
-                self.logger.info(f"ARP reply for {target_ip}")
+                self.logger.info("ARP reply for %s", target_ip)
                 return reply
         
         # Forward ARP request to other interfaces
@@ -124,22 +224,22 @@ class NetworkDevice(threading.Thread):
     
     def _handle_ospf_hello(self, message: Dict[str, Any]):
         """Handle OSPF hello messages"""
-        if self.device_type == DeviceType.ROUTER:
+        if self.device_type is DeviceType.ROUTER:
             # Send OSPF hello reply
             reply = {
                 'type': 'ospf_hello_reply',
                 'source': self.hostname,
-                'neighbors': self.neighbors
+                'neighbors': list(self.neighbors)
             }
-            self.logger.info(f"OSPF hello reply sent")
+            self.logger.info("OSPF hello reply sent")
     
     def _handle_routing_update(self, message: Dict[str, Any]):
         """Handle routing updates"""
-        if self.device_type == DeviceType.ROUTER:
+        if self.device_type is DeviceType.ROUTER:
             route = message.get('route')
             if route:
                 self.routing_table[route['destination']] = route['next_hop']
-                self.logger.info(f"Updated routing table: {route['destination']} -> {route['next_hop']}")
+                self.logger.info("Updated routing table: %s -> %s", route['destination'], route['next_hop'])
     
     def _handle_ping(self, message: Dict[str, Any]):
         """Handle ping messages"""
@@ -154,125 +254,172 @@ class NetworkDevice(threading.Thread):
                 'source_ip': target_ip,
                 'ttl': message.get('ttl', 64)
             }
-            self.logger.info(f"Ping reply sent to {source_ip}")
+            self.logger.info("Ping reply sent to %s", source_ip)
         else:
             # Forward ping to appropriate interface
             self._forward_ping(message)
     
     def _can_reach_ip(self, target_ip: str) -> bool:
         """Check if this device can reach the target IP"""
+        try:
+            target = int(ipaddress.IPv4Address(target_ip))
+        except ValueError:
+            return False
+        
         for interface in self.interfaces.values():
-            if interface.state == InterfaceState.UP:
-                try:
-                    interface_network = ipaddress.IPv4Network(
-                        f"{interface.ip_address}/{interface.subnet_mask}", 
-                        strict=False
-                    )
-                    target_network = ipaddress.IPv4Network(target_ip)
-                    if target_network.subnet_of(interface_network):
-                        return True
-                except ValueError:
-                    continue
+            if (interface.state is InterfaceState.UP and interface._network_int is not None
+                    and target & interface._netmask_int == interface._network_int):
+                return True
         return False
     
     def _forward_arp_request(self, message: Dict[str, Any]):
         """Forward ARP request to other interfaces"""
+        # Forwarding is only simulated by logging, so skip the scan when it would be dropped
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         for interface in self.interfaces.values():
-            if interface.state == InterfaceState.UP:
+            if interface.state is InterfaceState.UP:
                 # In a real implementation, this would send to connected devices
-                self.logger.debug(f"Forwarding ARP request via {interface.name}")
+                self.logger.debug("Forwarding ARP request via %s", interface.name)
     
     def _forward_ping(self, message: Dict[str, Any]):
         """Forward ping to appropriate interface"""
-        target_ip = message.get('target_ip')
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         for interface in self.interfaces.values():
-            if interface.state == InterfaceState.UP:
+            if interface.state is InterfaceState.UP:
                 # In a real implementation, this would send to connected devices
-                self.logger.debug(f"Forwarding ping via {interface.name}")
+                self.logger.debug("Forwarding ping via %s", interface.name)
     
     def simulate_periodic_tasks(self):
-        """Simulate periodic network tasks"""
+        """Run every periodic network task once"""
+        for _, task in self._periodic_tasks.values():
+            task()
+    
+    def _update_uptime(self):
+        """Record the current time as the device uptime stamp"""
+        self.statistics.uptime = time.time()
+    
+    def _send_keepalives(self):
+        """Send keep-alive messages to neighbors"""
         current_time = time.time()
-        
-        # Update uptime
-        self.statistics['uptime'] = current_time
-        
-        # Send keep-alive messages to neighbors
-        if self.neighbors:
-            for neighbor in self.neighbors:
-                keepalive = {
-                    'type': 'keepalive',
-                    'source': self.hostname,
-                    'timestamp': current_time
-                }
-                # In a real implementation, this would send to the neighbor
-                self.logger.debug(f"Keepalive sent to {neighbor}")
-        
-        # OSPF hello messages for routers
-        if self.device_type == DeviceType.ROUTER:
-            ospf_hello = {
-                'type': 'ospf_hello',
+        # Iterate a snapshot: the simulator may change neighbors from another thread
+        for neighbor in tuple(self.neighbors):
+            keepalive = {
+                'type': 'keepalive',
                 'source': self.hostname,
-                'neighbors': self.neighbors,
                 'timestamp': current_time
             }
-            # In a real implementation, this would broadcast to all interfaces
-            self.logger.debug("OSPF hello sent")
+            # In a real implementation, this would send to the neighbor
+            self.logger.debug("Keepalive sent to %s", neighbor)
     
-    def run(self):
+    def _send_ospf_hello(self):
+        """Send an OSPF hello (routers only)"""
+        ospf_hello = {
+            'type': 'ospf_hello',
+            'source': self.hostname,
+            'neighbors': list(self.neighbors),
+            'timestamp': time.time()
+        }
+        # In a real implementation, this would broadcast to all interfaces
+        self.logger.debug("OSPF hello sent")
+    
+    def _run_due_tasks(self, now: float):
+        """Run periodic tasks whose due time has passed and reschedule them"""
+        schedule = self._schedule
+        while schedule and schedule[0][0] <= now:
+            _, name = heapq.heappop(schedule)
+            interval, task = self._periodic_tasks[name]
+            # Reschedule first so a failing task still runs next interval
+            heapq.heappush(schedule, (now + interval, name))
+            task()
+    
+    async def run(self):
         """Main device simulation loop"""
         self.logger.info(f"Device {self.hostname} started")
-        start_time = time.time()
+        
+        loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        now = loop.time()
+        self._schedule = [(now + interval, name) for name, (interval, _) in self._periodic_tasks.items()]
+        heapq.heapify(self._schedule)
         
         while self.running:
             try:
-                # Process incoming messages
-                try:
-                    message = self.message_queue.get(timeout=1)
-                    self.process_message(message)
-                except queue.Empty:
-                    pass
+                messages = self.message_queue
+                if messages:
+                    # Drain what is pending, then yield so other devices on the loop get a turn
+                    for _ in range(len(messages)):
+                        self.process_message(messages.popleft())
+                    await asyncio.sleep(0)
+                else:
+                    # Sleep until mail arrives or the next periodic task is due
+                    timeout = self._schedule[0][0] - loop.time()
+                    if timeout > 0:
+                        self._wake.clear()
+                        self._idle = True
+                        if not messages and self.running:
+                            try:
+                                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                            except asyncio.TimeoutError:
+                                pass
+                        self._idle = False
+                        continue
                 
-                # Perform periodic tasks
-                self.simulate_periodic_tasks()
-                
-                # Small delay to prevent CPU overuse
-                time.sleep(0.1)
+                self._run_due_tasks(loop.time())
                 
             except Exception as e:
                 self.logger.error(f"Error in device {self.hostname}: {e}")
-                self.statistics['errors'] += 1
+                self.statistics.errors += 1
         
         self.logger.info(f"Device {self.hostname} stopped")
     
+    def start(self):
+        """Schedule the device on the shared event loop"""
+        if self._future is not None:
+            raise RuntimeError(f"Device {self.hostname} already started")
+        self._loop = _get_device_loop()
+        self._future = asyncio.run_coroutine_threadsafe(self.run(), self._loop)
+    
+    def is_alive(self) -> bool:
+        """Check whether the device loop is still running"""
+        return self._future is not None and not self._future.done()
+    
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the device loop to finish"""
+        if self._future is not None:
+            concurrent.futures.wait([self._future], timeout=timeout)
+    
     def stop(self):
         """Stop the device simulation"""
         self.running = False
+        if self._idle:
+            self._loop.call_soon_threadsafe(self._wake.set)
         self.logger.info(f"Stopping device {self.hostname}")
     
     def get_status(self) -> Dict[str, Any]:
         """Get current device status"""
         return {
             'hostname': self.hostname,
-            'device_type': self.device_type.value,
+            'device_type': self.device_type.name.lower(),
             'interfaces': {name: {
                 'ip_address': intf.ip_address,
                 'subnet_mask': intf.subnet_mask,
                 'bandwidth': intf.bandwidth,
                 'mtu': intf.mtu,
-                'state': intf.state.value,
+                'state': intf.state.name.lower(),
                 'vlan': intf.vlan
             } for name, intf in self.interfaces.items()},
-            'neighbors': self.neighbors,
+            'neighbors': list(self.neighbors),
             'routing_table': self.routing_table,
-            'statistics': self.statistics
+            'statistics': asdict(self.statistics)
         }
     
     def set_interface_state(self, interface_name: str, state: InterfaceState):
         """Set interface state"""
         if interface_name in self.interfaces:
             self.interfaces[interface_name].state = state
-            self.logger.info(f"Interface {interface_name} state changed to {state.value}")
+            self.logger.info(f"Interface {interface_name} state changed to {state.name.lower()}")
     
     def inject_fault(self, fault_type: str, **kwargs):
         """Inject various types of faults for testing"""
@@ -1,18 +1,26 @@
 import time
 import threading
+import collections
+import heapq
+import itertools
+import sched
 import logging
 import json
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple, Deque, Set, Mapping
 from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
 import queue
 
 from .device import NetworkDevice, DeviceType, InterfaceState
-from .topology_generator import NetworkTopology, NetworkLink, TopologyGenerator
+from .topology_generator import NetworkTopology, NetworkLink
 from .config_parser import ParsedConfig
 
 @dataclass
 class SimulationEvent:
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('timestamp', 'event_type', 'source_device', 'target_device', 'description', 'data')
+    
     timestamp: float
     event_type: str
     source_device: str
@@ -22,6 +30,9 @@ class SimulationEvent:
 
 @dataclass
 class FaultInjection:
+    __slots__ = ('fault_type', 'target_device', 'target_interface', 'parameters', 'duration',
+                 'start_time')
+    
     fault_type: str
     target_device: str
     target_interface: Optional[str]
@@ -29,10 +40,77 @@ class FaultInjection:
     duration: Optional[float]  # None for permanent faults
     start_time: Optional[float]
 
+# Seconds between periodic simulator tasks run from the event thread
+_FAULT_CHECK_INTERVAL = 1.0
+_STATISTICS_INTERVAL = 5.0
+# Longest the event thread blocks waiting for an event
+_EVENT_WAIT_TIMEOUT = 1.0
+# Most events handled per drain of the event queue
+_EVENT_BATCH_SIZE = 256
+# Default number of events kept in memory (overall and per event type)
+_MAX_EVENTS = 100000
+
+def _fault_to_dict(fault: FaultInjection) -> Dict[str, Any]:
+    """Convert a fault to its exported form"""
+    return {
+        'fault_type': fault.fault_type,
+        'target_device': fault.target_device,
+        'target_interface': fault.target_interface,
+        'parameters': fault.parameters,
+        'duration': fault.duration,
+        'start_time': fault.start_time
+    }
+
+def _json_default(obj: Any) -> Any:
+    """Encode objects carried in event data that json cannot handle natively"""
+    if isinstance(obj, FaultInjection):
+        return _fault_to_dict(obj)
+    if isinstance(obj, (set, frozenset, collections.deque)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class _EventBuffer:
+    """Multi-producer, single-consumer FIFO used for simulation events
+    
+    deque.append/popleft are atomic, so producers never take a lock; the
+    consumer is only signalled when it may be sleeping on an empty buffer.
+    """
+    
+    def __init__(self):
+        self._items = collections.deque()
+        self._ready = threading.Event()
+    
+    def put(self, item: Any):
+        """Append an item and wake the consumer if it is waiting"""
+        self._items.append(item)
+        if not self._ready.is_set():
+            self._ready.set()
+    
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Pop the oldest item, waiting up to timeout; raises queue.Empty"""
+        if not self._items:
+            self._ready.wait(timeout)
+            self._ready.clear()
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+    
+    def drain(self, max_items: int) -> List[Any]:
+        """Pop up to max_items already-queued items without waiting"""
+        items = self._items
+        batch = []
+        while items and len(batch) < max_items:
+            batch.append(items.popleft())
+        return batch
+
 class NetworkSimulator:
-    def __init__(self, topology: NetworkTopology):
+    def __init__(self, topology: NetworkTopology, max_events: int = _MAX_EVENTS):
         self.topology = topology
-        self.topology_generator = TopologyGenerator()  # Store reference to topology generator
+        # Neighbor lists taken from the topology adjacency once; used at start-up and on link recovery
+        self._topology_neighbors: Dict[str, Tuple[str, ...]] = {
+            hostname: tuple(adjacent) for hostname, adjacent in topology.adjacency.items()
+        }
         self.devices: Dict[str, NetworkDevice] = {}
         self.simulation_running = False
         self.simulation_paused = False
@@ -40,12 +118,22 @@ class NetworkSimulator:
         self.simulation_time = 0.0
         
         # Event tracking
-        self.events: List[SimulationEvent] = []
-        self.event_queue = queue.Queue()
+        # Most recent events overall and per type; older events are dropped
+        self.max_events = max_events
+        self.events: Deque[SimulationEvent] = collections.deque(maxlen=max_events)
+        self._events_by_type: Dict[str, Deque[SimulationEvent]] = collections.defaultdict(
+            lambda: collections.deque(maxlen=self.max_events)
+        )
+        self.event_queue = _EventBuffer()
         
         # Fault injection
-        self.active_faults: List[FaultInjection] = []
-        self.fault_history: List[FaultInjection] = []
+        # Active faults keyed by injection sequence number (FaultInjection is unhashable)
+        self.active_faults: Dict[int, FaultInjection] = {}
+        # Min-heap of (monotonic expiry, sequence number) for faults with a duration
+        self._fault_expiry: List[Tuple[float, int]] = []
+        self._fault_seq = itertools.count()
+        # Append-only audit of every injected fault; deque blocks grow without copying
+        self.fault_history: Deque[FaultInjection] = collections.deque()
         
         # Statistics
         self.statistics = {
@@ -56,6 +144,10 @@ class NetworkSimulator:
             'links_active': 0,
             'links_failed': 0
         }
+        # Devices whose device_start event has been handled (and not yet stopped)
+        self._online_devices: Set[str] = set()
+        # Day-1 ARP request messages per device, built on first use
+        self._arp_requests: Dict[str, List[Dict[str, Any]]] = {}
         
         # Setup logging
         self.logger = logging.getLogger(__name__)
@@ -63,9 +155,11 @@ class NetworkSimulator:
         
         # Initialize devices
         self._initialize_devices()
+        self.statistics['devices_offline'] = len(self.devices)
         
-        # Setup event handlers
-        self.event_handlers: Dict[str, List[Callable]] = {
+        # Setup event handlers; register through register_event_handler so the
+        # dispatch tuples below stay in sync
+        self._event_handlers: Dict[str, List[Callable]] = {
             'device_start': [],
             'device_stop': [],
             'link_failure': [],
@@ -74,23 +168,53 @@ class NetworkSimulator:
             'packet_received': [],
             'error_occurred': []
         }
+        # Fault handlers by fault type; memory_leak and packet_loss reuse the high CPU fault
+        self._apply_dispatch: Dict[str, Callable[[NetworkDevice, FaultInjection], None]] = {
+            'interface_down': self._apply_interface_down,
+            'link_failure': self._apply_link_failure,
+            'high_cpu': self._apply_resource_fault,
+            'memory_leak': self._apply_resource_fault,
+            'packet_loss': self._apply_resource_fault
+        }
+        self._remove_dispatch: Dict[str, Callable[[NetworkDevice, FaultInjection], None]] = {
+            'interface_down': self._remove_interface_down,
+            'link_failure': self._remove_link_failure
+        }
+        # Error-safe wrappers of the handlers above, per event type, read by the event loop
+        self._handler_tuples: Dict[str, Tuple[Callable, ...]] = {}
     
     def _initialize_devices(self):
         """Initialize network devices from topology"""
         self.logger.info("Initializing network devices...")
         
+        # Devices built from the same ParsedConfig object share one conversion
+        converted: Dict[int, Tuple[DeviceType, Dict[str, Any]]] = {}
+        
         for hostname, config in self.topology.devices.items():
-            # Determine device type based on configuration
-            device_type = self._determine_device_type(config)
+            entry = converted.get(id(config))
+            if entry is None:
+                # Determine device type based on configuration
+                entry = (self._determine_device_type(config), self._convert_config_for_device(config))
+                converted[id(config)] = entry
+            device_type, device_config = entry
             
             # Create device instance
-            device = NetworkDevice(hostname, device_type, self._convert_config_for_device(config))
+            device = NetworkDevice(hostname, device_type, device_config)
             self.devices[hostname] = device
             
             # Add neighbors based on topology
-            neighbors = self.topology_generator.get_device_neighbors(hostname)
-            for neighbor in neighbors:
-                device.add_neighbor(neighbor)
+            device.add_neighbors(self._topology_neighbors.get(hostname, ()))
+        
+        # Device order shared by the column-oriented status snapshots
+        self._device_order: List[str] = list(self.devices)
+        self._device_objs: List[NetworkDevice] = list(self.devices.values())
+        
+        # Resolve link endpoints once; links to unknown devices always count as failed
+        self._link_endpoints: List[Tuple[str, str]] = [
+            (link.source_device, link.target_device)
+            for link in self.topology.links
+            if link.source_device in self.devices and link.target_device in self.devices
+        ]
         
         self.logger.info(f"Initialized {len(self.devices)} devices")
     
@@ -137,23 +261,24 @@ class NetworkSimulator:
         self.simulation_running = True
         self.simulation_paused = False
         self.simulation_start_time = time.time()
+        # Elapsed simulation time is measured on the monotonic clock
+        self._start_monotonic = self._now = time.monotonic()
         
-        # Start all devices
-        for device in self.devices.values():
+        # Start all devices; online/offline counts follow their start/stop events
+        for hostname, device in self.devices.items():
             device.start()
+            self._record_event('device_start', hostname, None, f"Device {hostname} started", {},
+                               timestamp=self.simulation_start_time)
+        
+        # Periodic fault expiry and statistics run on the event thread's scheduler
+        self._scheduler = sched.scheduler(time.monotonic, time.sleep)
+        self._scheduler.enter(_FAULT_CHECK_INTERVAL, 1, self._process_faults)
+        self._scheduler.enter(_STATISTICS_INTERVAL, 1, self._collect_statistics)
         
         # Start event processing thread
         self.event_thread = threading.Thread(target=self._process_events, daemon=True)
         self.event_thread.start()
         
-        # Start fault injection thread
-        self.fault_thread = threading.Thread(target=self._process_faults, daemon=True)
-        self.fault_thread.start()
-        
-        # Start statistics collection thread
-        self.stats_thread = threading.Thread(target=self._collect_statistics, daemon=True)
-        self.stats_thread.start()
-        
         self.logger.info("Network simulation started successfully")
     
     def stop_simulation(self):
@@ -166,13 +291,20 @@ class NetworkSimulator:
         self.simulation_running = False
         
         # Stop all devices
-        for device in self.devices.values():
+        stop_time = time.time()
+        for hostname, device in self.devices.items():
             device.stop()
+            self._record_event('device_stop', hostname, None, f"Device {hostname} stopped", {},
+                               timestamp=stop_time)
         
         # Wait for devices to stop
         for device in self.devices.values():
             device.join(timeout=5)
         
+        # The event thread exits once it sees the stop; handle whatever it left queued
+        self.event_thread.join(timeout=5)
+        self._flush_events()
+        
         self.logger.info("Network simulation stopped")
     
     def pause_simulation(self):
@@ -199,151 +331,171 @@ class NetworkSimulator:
                      duration: Optional[float] = None):
         """Inject a fault into the network"""
         if target_device not in self.devices:
-            self.logger.error(f"Target device {target_device} not found")
+            self.logger.error("Target device %s not found", target_device)
             return
         
+        now = time.time()
         fault = FaultInjection(
             fault_type=fault_type,
             target_device=target_device,
             target_interface=target_interface,
             parameters=parameters or {},
             duration=duration,
-            start_time=time.time() if duration else None
+            start_time=now if duration else None
         )
         
-        self.active_faults.append(fault)
+        seq = next(self._fault_seq)
+        self.active_faults[seq] = fault
         self.fault_history.append(fault)
+        if duration:
+            heapq.heappush(self._fault_expiry, (time.monotonic() + duration, seq))
         
         # Apply the fault
         self._apply_fault(fault)
         
-        self.logger.info(f"Fault injected: {fault_type} on {target_device}")
+        self.logger.info("Fault injected: %s on %s", fault_type, target_device)
         
         # Record event
         self._record_event('fault_injected', target_device, None, 
-                          f"Fault {fault_type} injected", {'fault': fault})
+                          f"Fault {fault_type} injected", {'fault': fault}, timestamp=now)
     
     def _apply_fault(self, fault: FaultInjection):
         """Apply a fault to the target device"""
-        device = self.devices[fault.target_device]
-        
-        if fault.fault_type == 'interface_down':
-            if fault.target_interface:
-                device.set_interface_state(fault.target_interface, InterfaceState.DOWN)
-            else:
-                # Bring down all interfaces
-                for intf_name in device.interfaces.keys():
-                    device.set_interface_state(intf_name, InterfaceState.DOWN)
-        
-        elif fault.fault_type == 'link_failure':
-            # Remove neighbors
-            neighbors = device.neighbors.copy()
-            for neighbor in neighbors:
-                device.remove_neighbor(neighbor)
-                # Also remove from the other device
-                if neighbor in self.devices:
-                    self.devices[neighbor].remove_neighbor(fault.target_device)
-        
-        elif fault.fault_type == 'high_cpu':
-            # Simulate high CPU usage
-            device.inject_fault('high_cpu')
-        
-        elif fault.fault_type == 'memory_leak':
-            # Simulate memory issues
-            device.inject_fault('high_cpu')  # Use existing fault type
-        
-        elif fault.fault_type == 'packet_loss':
-            # Simulate packet loss
-            device.inject_fault('high_cpu')  # Use existing fault type
-        
+        handler = self._apply_dispatch.get(fault.fault_type)
+        if handler is not None:
+            handler(self.devices[fault.target_device], fault)
         else:
-            self.logger.warning(f"Unknown fault type: {fault.fault_type}")
+            self.logger.warning("Unknown fault type: %s", fault.fault_type)
     
     def _remove_fault(self, fault: FaultInjection):
         """Remove a fault from the target device"""
-        device = self.devices[fault.target_device]
-        
-        if fault.fault_type == 'interface_down':
-            if fault.target_interface:
-                device.set_interface_state(fault.target_interface, InterfaceState.UP)
-            else:
-                # Bring up all interfaces
-                for intf_name in device.interfaces.keys():
-                    device.set_interface_state(intf_name, InterfaceState.UP)
-        
-        elif fault.fault_type == 'link_failure':
-            # Restore neighbors based on topology
-            neighbors = self.topology_generator.get_device_neighbors(fault.target_device)
-            for neighbor in neighbors:
-                device.add_neighbor(neighbor)
-                # Also add to the other device
-                if neighbor in self.devices:
-                    self.devices[neighbor].add_neighbor(fault.target_device)
-        
-        self.logger.info(f"Fault removed: {fault.fault_type} from {fault.target_device}")
+        # Fault types without a recovery handler need no cleanup
+        handler = self._remove_dispatch.get(fault.fault_type)
+        if handler is not None:
+            handler(self.devices[fault.target_device], fault)
+        
+        self.logger.info("Fault removed: %s from %s", fault.fault_type, fault.target_device)
+    
+    def _apply_interface_down(self, device: NetworkDevice, fault: FaultInjection):
+        """Bring down the target interface, or all interfaces if none is given"""
+        if fault.target_interface:
+            device.set_interface_state(fault.target_interface, InterfaceState.DOWN)
+        else:
+            for intf_name in device.interfaces.keys():
+                device.set_interface_state(intf_name, InterfaceState.DOWN)
+    
+    def _remove_interface_down(self, device: NetworkDevice, fault: FaultInjection):
+        """Bring the interfaces taken down by an interface_down fault back up"""
+        if fault.target_interface:
+            device.set_interface_state(fault.target_interface, InterfaceState.UP)
+        else:
+            for intf_name in device.interfaces.keys():
+                device.set_interface_state(intf_name, InterfaceState.UP)
+    
+    def _apply_link_failure(self, device: NetworkDevice, fault: FaultInjection):
+        """Remove neighbors, then drop this device from each former neighbor"""
+        for neighbor in device.clear_neighbors():
+            peer = self.devices.get(neighbor)
+            if peer is not None:
+                peer.remove_neighbor(fault.target_device)
+    
+    def _remove_link_failure(self, device: NetworkDevice, fault: FaultInjection):
+        """Restore neighbors on both ends based on the topology"""
+        neighbors = self._topology_neighbors.get(fault.target_device, ())
+        device.add_neighbors(neighbors)
+        for neighbor in neighbors:
+            peer = self.devices.get(neighbor)
+            if peer is not None:
+                peer.add_neighbor(fault.target_device)
+    
+    def _apply_resource_fault(self, device: NetworkDevice, fault: FaultInjection):
+        """Simulate high CPU, memory and packet loss faults as device CPU load"""
+        device.inject_fault('high_cpu')
     
     def _process_faults(self):
-        """Process fault injection and recovery"""
-        while self.simulation_running:
-            try:
-                current_time = time.time()
-                faults_to_remove = []
-                
-                for fault in self.active_faults:
-                    if fault.duration and fault.start_time:
-                        if current_time - fault.start_time >= fault.duration:
-                            # Fault duration expired, remove it
-                            self._remove_fault(fault)
-                            faults_to_remove.append(fault)
-                
-                # Remove expired faults
-                for fault in faults_to_remove:
-                    self.active_faults.remove(fault)
-                
-                time.sleep(1)  # Check every second
-                
-            except Exception as e:
-                self.logger.error(f"Error processing faults: {e}")
+        """Recover faults whose duration has expired"""
+        try:
+            # Pop only the faults whose duration has expired
+            current_time = self._now
+            expiry = self._fault_expiry
+            while expiry and expiry[0][0] <= current_time:
+                _, seq = heapq.heappop(expiry)
+                fault = self.active_faults.pop(seq, None)
+                if fault is not None:
+                    self._remove_fault(fault)
+        except Exception as e:
+            self.logger.error("Error processing faults: %s", e)
+        
+        if self.simulation_running:
+            self._scheduler.enter(_FAULT_CHECK_INTERVAL, 1, self._process_faults)
     
     def _process_events(self):
-        """Process simulation events"""
+        """Process simulation events and run scheduled periodic tasks"""
+        # Loop-invariant lookups bound once rather than resolved every iteration
+        monotonic = time.monotonic
+        run_scheduled = self._scheduler.run
+        get_event = self.event_queue.get
+        drain_events = self.event_queue.drain
+        handle_events = self._handle_events
+        start = self._start_monotonic
+        
         while self.simulation_running:
             try:
-                # Process events from queue
+                # Run due periodic tasks; wait for events no longer than the next one
+                delay = run_scheduled(blocking=False)
+                timeout = _EVENT_WAIT_TIMEOUT if delay is None else min(delay, _EVENT_WAIT_TIMEOUT)
+                
+                # Process events from queue, taking whatever else is pending in the same batch
                 try:
-                    event = self.event_queue.get(timeout=1)
-                    self._handle_event(event)
+                    event = get_event(timeout=timeout)
                 except queue.Empty:
                     pass
+                else:
+                    batch = drain_events(_EVENT_BATCH_SIZE - 1)
+                    batch.insert(0, event)
+                    handle_events(batch)
                 
-                # Update simulation time
+                # One clock read per drain, after the wait, shared by simulation time
+                # and the periodic tasks run at the top of the next iteration
+                self._now = now = monotonic()
                 if not self.simulation_paused:
-                    self.simulation_time = time.time() - self.simulation_start_time
+                    self.simulation_time = now - start
                 
             except Exception as e:
-                self.logger.error(f"Error processing events: {e}")
+                self.logger.error("Error processing events: %s", e)
     
-    def _handle_event(self, event: SimulationEvent):
-        """Handle a simulation event"""
-        # Add to events list
-        self.events.append(event)
-        
-        # Call registered event handlers
-        if event.event_type in self.event_handlers:
-            for handler in self.event_handlers[event.event_type]:
-                try:
-                    handler(event)
-                except Exception as e:
-                    self.logger.error(f"Error in event handler: {e}")
+    def _flush_events(self):
+        """Handle every event still queued, without waiting"""
+        while True:
+            batch = self.event_queue.drain(_EVENT_BATCH_SIZE)
+            if not batch:
+                return
+            self._handle_events(batch)
+    
+    def _handle_events(self, batch: List[SimulationEvent]):
+        """Handle a batch of simulation events in arrival order"""
+        append_event = self.events.append
+        events_by_type = self._events_by_type
+        handler_tuples = self._handler_tuples
+        
+        for event in batch:
+            # Add to events list
+            append_event(event)
+            events_by_type[event.event_type].append(event)
+            
+            # Call registered event handlers (already wrapped to log their errors)
+            for handler in handler_tuples.get(event.event_type, ()):
+                handler(event)
         
         # Update statistics
-        self._update_statistics(event)
+        self._update_statistics(batch)
     
     def _record_event(self, event_type: str, source_device: str, 
-                     target_device: Optional[str], description: str, data: Dict[str, Any]):
-        """Record a simulation event"""
+                     target_device: Optional[str], description: str, data: Dict[str, Any],
+                     timestamp: Optional[float] = None):
+        """Record a simulation event, stamped now unless the caller already read the clock"""
         event = SimulationEvent(
-            timestamp=time.time(),
+            timestamp=timestamp if timestamp is not None else time.time(),
             event_type=event_type,
             source_device=source_device,
             target_device=target_device,
@@ -353,73 +505,64 @@ class NetworkSimulator:
         
         self.event_queue.put(event)
     
-    def _update_statistics(self, event: SimulationEvent):
-        """Update simulation statistics based on events"""
-        if event.event_type == 'packet_sent':
-            self.statistics['total_packets'] += 1
-        elif event.event_type == 'error_occurred':
-            self.statistics['total_errors'] += 1
-        elif event.event_type == 'device_start':
-            self.statistics['devices_online'] += 1
-        elif event.event_type == 'device_stop':
-            self.statistics['devices_offline'] += 1
+    def _update_statistics(self, batch: List[SimulationEvent]):
+        """Update simulation statistics based on a batch of events"""
+        statistics = self.statistics
+        counts = collections.Counter(event.event_type for event in batch)
+        statistics['total_packets'] += counts['packet_sent']
+        statistics['total_errors'] += counts['error_occurred']
+        
+        # Device start/stop must be applied in order to track which devices are online
+        if counts['device_start'] or counts['device_stop']:
+            online = self._online_devices
+            for event in batch:
+                event_type = event.event_type
+                if event_type == 'device_start':
+                    if event.source_device not in online:
+                        online.add(event.source_device)
+                        statistics['devices_online'] += 1
+                        statistics['devices_offline'] -= 1
+                elif event_type == 'device_stop':
+                    if event.source_device in online:
+                        online.discard(event.source_device)
+                        statistics['devices_online'] -= 1
+                        statistics['devices_offline'] += 1
     
     def _collect_statistics(self):
-        """Collect real-time statistics from devices"""
-        while self.simulation_running:
-            try:
-                if not self.simulation_paused:
-                    # Count online/offline devices
-                    online_count = 0
-                    offline_count = 0
-                    
-                    for device in self.devices.values():
-                        if device.is_alive():
-                            online_count += 1
-                        else:
-                            offline_count += 1
-                    
-                    self.statistics['devices_online'] = online_count
-                    self.statistics['devices_offline'] = offline_count
-                    
-                    # Count active/failed links
-                    active_links = 0
-                    failed_links = 0
-                    
-                    for link in self.topology.links:
-                        source_device = self.devices.get(link.source_device)
-                        target_device = self.devices.get(link.target_device)
-                        
-                        if (source_device and target_device and 
-                            source_device.is_alive() and target_device.is_alive()):
-                            active_links += 1
-                        else:
-                            failed_links += 1
-                    
-                    self.statistics['links_active'] = active_links
-                    self.statistics['links_failed'] = failed_links
-                
-                time.sleep(5)  # Update every 5 seconds
+        """Collect real-time link statistics"""
+        try:
+            if not self.simulation_paused:
+                # Count active/failed links; device online state is tracked from events
+                online = self._online_devices
+                active_links = sum(
+                    1 for source, target in self._link_endpoints
+                    if source in online and target in online
+                )
                 
-            except Exception as e:
-                self.logger.error(f"Error collecting statistics: {e}")
+                self.statistics['links_active'] = active_links
+                self.statistics['links_failed'] = len(self.topology.links) - active_links
+        except Exception as e:
+            self.logger.error(f"Error collecting statistics: {e}")
+        
+        if self.simulation_running:
+            self._scheduler.enter(_STATISTICS_INTERVAL, 1, self._collect_statistics)
     
     def send_packet(self, source_device: str, target_device: str, 
                    packet_type: str, packet_data: Dict[str, Any]):
         """Send a packet between devices"""
-        if source_device not in self.devices or target_device not in self.devices:
-            self.logger.error(f"Invalid device names: {source_device} -> {target_device}")
+        devices = self.devices
+        target = devices.get(target_device)
+        if target is None or source_device not in devices:
+            self.logger.error("Invalid device names: %s -> %s", source_device, target_device)
             return
         
-        source = self.devices[source_device]
-        target = self.devices[target_device]
-        
         # Create packet message
+        now = time.time()
         packet = {
             'type': packet_type,
             'source': source_device,
             'target': target_device,
-            'timestamp': time.time(),
+            'timestamp': now,
             'data': packet_data
         }
         
@@ -428,9 +571,9 @@ class NetworkSimulator:
         
         # Record event
         self._record_event('packet_sent', source_device, target_device, 
-                          f"Packet sent: {packet_type}", packet_data)
+                          f"Packet sent: {packet_type}", packet_data, timestamp=now)
         
-        self.logger.debug(f"Packet sent from {source_device} to {target_device}: {packet_type}")
+        self.logger.debug("Packet sent from %s to %s: %s", source_device, target_device, packet_type)
     
     def get_device_status(self, device_name: str) -> Optional[Dict[str, Any]]:
         """Get status of a specific device"""
@@ -440,8 +583,18 @@ class NetworkSimulator:
         device = self.devices[device_name]
         return device.get_status()
     
-    def get_network_status(self) -> Dict[str, Any]:
-        """Get overall network status"""
+    def get_device_snapshot(self) -> Dict[str, List[Any]]:
+        """Get per-device status as parallel lists indexed by device order"""
+        devices = self._device_objs
+        return {
+            'hostnames': self._device_order,
+            'online': [device.is_alive() for device in devices],
+            'neighbors': [list(device.neighbors) for device in devices],
+            'interfaces': [len(device.interfaces) for device in devices]
+        }
+    
+    def get_network_status(self, include_devices: bool = True) -> Dict[str, Any]:
+        """Get overall network status, optionally without the per-device breakdown"""
         status = {
             'simulation_running': self.simulation_running,
             'simulation_paused': self.simulation_paused,
@@ -452,12 +605,15 @@ class NetworkSimulator:
             'devices': {}
         }
         
-        # Get status of each device
-        for hostname, device in self.devices.items():
-            status['devices'][hostname] = {
-                'online': device.is_alive(),
-                'neighbors': device.neighbors.copy(),
-                'interfaces': len(device.interfaces)
+        if include_devices:
+            # Build the per-device view from the column snapshot
+            snapshot = self.get_device_snapshot()
+            status['devices'] = {
+                hostname: {'online': online, 'neighbors': neighbors, 'interfaces': interfaces}
+                for hostname, online, neighbors, interfaces in zip(
+                    snapshot['hostnames'], snapshot['online'],
+                    snapshot['neighbors'], snapshot['interfaces']
+                )
             }
         
         return status
@@ -465,61 +621,84 @@ class NetworkSimulator:
     def get_simulation_events(self, event_type: Optional[str] = None, 
                              limit: Optional[int] = None) -> List[SimulationEvent]:
         """Get simulation events, optionally filtered by type"""
-        events = self.events
-        
         if event_type:
-            events = [e for e in events if e.event_type == event_type]
+            events = self._events_by_type.get(event_type, ())
+        else:
+            events = self.events
         
         if limit:
-            events = events[-limit:]
+            # Take the newest `limit` events without copying the whole buffer
+            recent = list(itertools.islice(reversed(events), limit))
+            recent.reverse()
+            return recent
         
-        return events
+        return list(events)
+    
+    @property
+    def event_handlers(self) -> Mapping[str, Tuple[Callable, ...]]:
+        """Read-only view of the registered event handlers by event type"""
+        return MappingProxyType({
+            event_type: tuple(handlers) for event_type, handlers in self._event_handlers.items()
+        })
     
     def register_event_handler(self, event_type: str, handler: Callable):
         """Register an event handler"""
-        if event_type not in self.event_handlers:
-            self.event_handlers[event_type] = []
+        if event_type not in self._event_handlers:
+            self._event_handlers[event_type] = []
         
-        self.event_handlers[event_type].append(handler)
+        self._event_handlers[event_type].append(handler)
+        self._handler_tuples[event_type] = self._handler_tuples.get(event_type, ()) + (self._safe_handler(handler),)
         self.logger.info(f"Registered event handler for {event_type}")
     
+    def _safe_handler(self, handler: Callable) -> Callable:
+        """Wrap an event handler so its exceptions are logged instead of propagating"""
+        logger = self.logger
+        
+        def safe(event: SimulationEvent):
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error("Error in event handler: %s", e)
+        
+        return safe
+    
     def export_simulation_log(self, output_file: str):
         """Export simulation events and statistics to a log file"""
-        log_data = {
-            'simulation_info': {
-                'start_time': self.simulation_start_time,
-                'end_time': time.time() if not self.simulation_running else None,
-                'total_time': self.simulation_time,
-                'total_events': len(self.events),
-                'total_faults': len(self.fault_history)
-            },
-            'statistics': self.statistics,
-            'events': [
-                {
+        simulation_info = {
+            'start_time': self.simulation_start_time,
+            'end_time': time.time() if not self.simulation_running else None,
+            'total_time': self.simulation_time,
+            'total_events': len(self.events),
+            'total_faults': len(self.fault_history)
+        }
+        
+        # Stream one compact record per line instead of building and indenting one big document
+        encode = json.JSONEncoder(default=_json_default).encode
+        with open(output_file, 'w') as f:
+            f.write('{"simulation_info": ')
+            f.write(encode(simulation_info))
+            f.write(',\n"statistics": ')
+            f.write(encode(self.statistics))
+            f.write(',\n"events": [')
+            separator = '\n'
+            for event in self.events:
+                f.write(separator)
+                f.write(encode({
                     'timestamp': event.timestamp,
                     'event_type': event.event_type,
                     'source_device': event.source_device,
                     'target_device': event.target_device,
                     'description': event.description,
                     'data': event.data
-                }
-                for event in self.events
-            ],
-            'faults': [
-                {
-                    'fault_type': fault.fault_type,
-                    'target_device': fault.target_device,
-                    'target_interface': fault.target_interface,
-                    'parameters': fault.parameters,
-                    'duration': fault.duration,
-                    'start_time': fault.start_time
-                }
-                for fault in self.fault_history
-            ]
-        }
-        
-        with open(output_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
+                }))
+                separator = ',\n'
+            f.write('\n],\n"faults": [')
+            separator = '\n'
+            for fault in self.fault_history:
+                f.write(separator)
+                f.write(encode(_fault_to_dict(fault)))
+                separator = ',\n'
+            f.write('\n]}\n')
         
         self.logger.info(f"Simulation log exported to {output_file}")
     
@@ -527,39 +706,24 @@ class NetworkSimulator:
         """Run Day-1 network discovery scenario"""
         self.logger.info("Running Day-1 network discovery scenario...")
         
-        # Simulate ARP discovery
-        for device_name, device in self.devices.items():
-            for interface in device.interfaces.values():
-                if interface.ip_address:
-                    # Send ARP request
-                    arp_request = {
-                        'type': 'arp_request',
-                        'target_ip': interface.ip_address,
-                        'source_mac': f"MAC_{device_name}_{interface.name}"
-                    }
-                    device.send_message(arp_request)
-        
-        # Simulate OSPF discovery for routers
-        for device_name, device in self.devices.items():
-            if device.device_type == DeviceType.ROUTER:
-                # Send OSPF hello
-                ospf_hello = {
-                    'type': 'ospf_hello',
-                    'source': device_name,
-                    'neighbors': device.neighbors
-                }
-                device.send_message(ospf_hello)
-        
-        # Simulate neighbor discovery
+        # One pass per device: ARP requests, an OSPF hello for routers, then
+        # neighbor discovery, queued on the device in a single batch
         for device_name, device in self.devices.items():
-            for neighbor in device.neighbors:
-                # Send neighbor discovery message
-                neighbor_msg = {
-                    'type': 'neighbor_discovery',
-                    'source': device_name,
-                    'target': neighbor
-                }
-                device.send_message(neighbor_msg)
+            arp_requests = self._arp_requests.get(device_name)
+            if arp_requests is None:
+                # Interface addressing is fixed once the device is built
+                arp_requests = self._arp_requests[device_name] = [
+                    {'type': 'arp_request', 'target_ip': interface.ip_address,
+                     'source_mac': interface.mac_string}
+                    for interface in device.interfaces.values() if interface.ip_address
+                ]
+            messages = list(arp_requests)
+            neighbors = list(device.neighbors)
+            if device.device_type is DeviceType.ROUTER:
+                messages.append({'type': 'ospf_hello', 'source': device_name, 'neighbors': neighbors})
+            messages.extend({'type': 'neighbor_discovery', 'source': device_name, 'target': neighbor}
+                            for neighbor in neighbors)
+            device.send_messages(messages)
         
         self.logger.info("Day-1 scenario completed")
     
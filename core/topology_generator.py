@@ -1,12 +1,17 @@
 import networkx as nx
-import ipaddress
+import collections
+import copy
+import json
+from array import array
 import logging
-from typing import Dict, List, Any, Tuple, Optional
+import operator
+from typing import Dict, List, Any, Mapping, Tuple, Optional, NamedTuple
 from dataclasses import dataclass
 from .config_parser import ParsedConfig, ParsedInterface
+from .utils import parse_network_int
 
-@dataclass
-class NetworkLink:
+# Links are never modified after creation, so a tuple is enough
+class NetworkLink(NamedTuple):
     source_device: str
     source_interface: str
     target_device: str
@@ -16,276 +21,414 @@ class NetworkLink:
     reliability: float
     link_type: str  # 'ethernet', 'serial', 'fiber', etc.
 
-@dataclass
+def _link_adjacency(devices: Dict[str, ParsedConfig], links: List[NetworkLink]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Device -> neighbor -> link attributes, ordered as NetworkX would report them"""
+    adjacency: Dict[str, Dict[str, Dict[str, Any]]] = {hostname: {} for hostname in devices}
+    for link in links:
+        attributes = {
+            'bandwidth': link.bandwidth,
+            'latency': link.latency,
+            'reliability': link.reliability,
+            'link_type': link.link_type
+        }
+        # Repeated links between two devices update the existing edge, as in NetworkX
+        existing = adjacency.setdefault(link.source_device, {}).get(link.target_device)
+        if existing is not None:
+            existing.update(attributes)
+        else:
+            adjacency[link.source_device][link.target_device] = attributes
+            adjacency.setdefault(link.target_device, {})[link.source_device] = attributes
+    return adjacency
+
+@dataclass(init=False)
 class NetworkTopology:
+    """Devices and links of a network, with connectivity views derived on demand
+    
+    graph may be None, in which case a NetworkX graph is built from the links on
+    first use. The adjacency, integer node ids and bandwidth column are derived
+    from the assigned graph or, without one, from the links; they are rebuilt when
+    a graph is assigned or the number of links changes.
+    """
     devices: Dict[str, ParsedConfig]
     links: List[NetworkLink]
-    graph: nx.Graph
-    subnets: Dict[str, List[str]]
-    vlans: Dict[int, List[str]]
-    routing_domains: Dict[str, List[str]]
+    subnets: Dict[str, Tuple[str, ...]]
+    vlans: Dict[int, Tuple[str, ...]]
+    routing_domains: Dict[str, Tuple[str, ...]]
+    
+    def __init__(self, devices: Dict[str, ParsedConfig], links: List[NetworkLink], graph: Optional[nx.Graph],
+                 subnets: Dict[str, Tuple[str, ...]], vlans: Dict[int, Tuple[str, ...]],
+                 routing_domains: Dict[str, Tuple[str, ...]]):
+        self.devices = devices
+        self.links = links
+        self.subnets = subnets
+        self.vlans = vlans
+        self.routing_domains = routing_domains
+        self._graph = graph
+        self._reset_views()
+    
+    def _reset_views(self):
+        self._views_revision = self._revision()
+        self._built_graph: Optional[nx.Graph] = None
+        self._adjacency: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+        # Hostnames by integer id, ids by hostname, and neighbor ids per id
+        self._node_ids: Optional[Tuple[List[str], Dict[str, int], List[List[int]]]] = None
+        self._link_bandwidths: Optional[array] = None
+    
+    def _revision(self) -> Tuple[Optional[nx.Graph], int]:
+        """Changes whenever a graph is assigned or links are added or removed"""
+        return (self._graph, len(self.links))
+    
+    def _check_views(self):
+        """Drop derived views built for an earlier graph or link list"""
+        revision = self._views_revision
+        if revision[0] is not self._graph or revision[1] != len(self.links):
+            self._reset_views()
+    
+    @property
+    def graph(self) -> nx.Graph:
+        """NetworkX graph of the topology; built from the links on first use unless assigned"""
+        if self._graph is not None:
+            return self._graph
+        self._check_views()
+        if self._built_graph is None:
+            graph = nx.Graph()
+            graph.add_nodes_from((hostname, {'config': config}) for hostname, config in self.devices.items())
+            graph.add_edges_from(
+                (link.source_device, link.target_device, {
+                    'bandwidth': link.bandwidth,
+                    'latency': link.latency,
+                    'reliability': link.reliability,
+                    'link_type': link.link_type
+                })
+                for link in self.links
+            )
+            self._built_graph = graph
+        return self._built_graph
+    
+    @graph.setter
+    def graph(self, graph: Optional[nx.Graph]):
+        self._graph = graph
+    
+    @property
+    def adjacency(self) -> Mapping[str, Mapping[str, Dict[str, Any]]]:
+        """Device -> neighbor -> link attributes, read-only"""
+        self._check_views()
+        if self._adjacency is None:
+            self._adjacency = self._graph.adj if self._graph is not None else _link_adjacency(self.devices, self.links)
+        return self._adjacency
+    
+    @property
+    def link_bandwidths(self) -> array:
+        """Link bandwidths (Mbps) in link order, packed for whole-column aggregation"""
+        self._check_views()
+        if self._link_bandwidths is None:
+            self._link_bandwidths = array('q', [link.bandwidth for link in self.links])
+        return self._link_bandwidths
+    
+    def _indexed_adjacency(self) -> Tuple[List[str], Dict[str, int], List[List[int]]]:
+        """Adjacency with devices numbered 0..n-1 in adjacency order, for graph traversals"""
+        adjacency = self.adjacency
+        if self._node_ids is None:
+            hostnames = list(adjacency)
+            host_ids = {hostname: i for i, hostname in enumerate(hostnames)}
+            neighbor_ids = [[host_ids[neighbor] for neighbor in adjacency[hostname]] for hostname in hostnames]
+            self._node_ids = (hostnames, host_ids, neighbor_ids)
+        return self._node_ids
+
+def _format_network(network: int, prefix: int) -> str:
+    """Format a network as CIDR text, e.g. 10.0.0.0/24"""
+    return f"{network >> 24}.{(network >> 16) & 255}.{(network >> 8) & 255}.{network & 255}/{prefix}"
+
+# Base latency (ms) and reliability (0.0 to 1.0) by interface type
+_BASE_LATENCIES = {
+    'GigabitEthernet': 0.1,
+    'FastEthernet': 0.5,
+    'Ethernet': 1.0,
+    'Serial': 5.0,
+    'Loopback': 0.01
+}
+_BASE_RELIABILITY = {
+    'GigabitEthernet': 0.9999,
+    'FastEthernet': 0.9995,
+    'Ethernet': 0.9990,
+    'Serial': 0.9980,
+    'Loopback': 1.0
+}
+
+# Link type named after the fastest interface type on either end, in priority order
+_LINK_TYPE_PRIORITY = (
+    ('GigabitEthernet', 'gigabit_ethernet'),
+    ('FastEthernet', 'fast_ethernet'),
+    ('Serial', 'serial'),
+    ('Loopback', 'loopback')
+)
+
+def _scan_connectivity(nodes: List[str], neighbors: List[List[int]]) -> Tuple[List[str], int]:
+    """Find articulation points and count connected components of an indexed adjacency
+    
+    Iterative Tarjan DFS over integer node ids; nodes and neighbors are visited
+    in the same order as nx.articulation_points, so points are reported in its order.
+    """
+    discovery = [-1] * len(nodes)
+    low = [0] * len(nodes)
+    is_point = [False] * len(nodes)
+    points: List[str] = []
+    components = 0
+    counter = 0
+    
+    for start in range(len(nodes)):
+        if discovery[start] >= 0:
+            continue
+        components += 1
+        discovery[start] = low[start] = counter
+        counter += 1
+        root_children = 0
+        stack = [(start, start, iter(neighbors[start]))]
+        
+        while stack:
+            grandparent, parent, children = stack[-1]
+            child = next(children, -1)
+            if child < 0:
+                # All children of parent explored
+                stack.pop()
+                if len(stack) > 1:
+                    if low[parent] >= discovery[grandparent] and not is_point[grandparent]:
+                        is_point[grandparent] = True
+                        points.append(nodes[grandparent])
+                    low[grandparent] = min(low[parent], low[grandparent])
+                elif stack:
+                    root_children += 1
+            elif child == grandparent:
+                continue
+            elif discovery[child] >= 0:
+                # Back edge
+                if discovery[child] <= discovery[parent]:
+                    low[parent] = min(low[parent], discovery[child])
+            else:
+                discovery[child] = low[child] = counter
+                counter += 1
+                stack.append((parent, child, iter(neighbors[child])))
+        
+        # The DFS root is an articulation point if it has more than one child
+        if root_children > 1 and not is_point[start]:
+            is_point[start] = True
+            points.append(nodes[start])
+    
+    return points, components
+
+# Unreached nodes in a shortest-path tree; the source's parent is -1
+_UNREACHED = -2
+
+def _bfs_parents(neighbors: List[List[int]], source: int) -> List[int]:
+    """Breadth-first shortest-path tree from a node id, as a parent id per node
+    
+    Neighbors are visited in adjacency order, so each path read from the tree is
+    the one nx.single_source_shortest_path reports for that target.
+    """
+    parents = [_UNREACHED] * len(neighbors)
+    parents[source] = -1
+    fringe = [source]
+    for node in fringe:
+        for neighbor in neighbors[node]:
+            if parents[neighbor] == _UNREACHED:
+                parents[neighbor] = node
+                fringe.append(neighbor)
+    return parents
+
+# Sources whose shortest-path tree is remembered, least recently used dropped first
+_PATH_TREE_CACHE_SIZE = 256
+
+# Routing domains in report order; devices with a default gateway form the Static domain
+_ROUTING_DOMAIN_ORDER = ('OSPF', 'BGP', 'EIGRP', 'RIP', 'Static')
+
+# Link candidates sharing one subnet: (scan position, hostname, interface, interface type)
+_LinkBucket = List[Tuple[int, str, ParsedInterface, str]]
+
+# Topology version, topology and topology revision that cached results belong to
+_CacheOwner = Tuple[int, NetworkTopology, Tuple[Optional[nx.Graph], int]]
 
 class TopologyGenerator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.topology = None
+        # Bumped whenever a topology is generated; caches are kept per version, topology
+        # and topology revision (see _cache_owner)
+        self._topology_version = 0
+        self._analysis_cache: Optional[Tuple[_CacheOwner, Dict[str, Any]]] = None
+        self._path_trees: 'collections.OrderedDict[str, List[int]]' = collections.OrderedDict()
+        self._path_cache_owner: Optional[_CacheOwner] = None
         
     def generate_topology(self, configs: Dict[str, ParsedConfig]) -> NetworkTopology:
         """Generate network topology from device configurations"""
         self.logger.info("Generating network topology...")
         
-        # Create network graph
-        graph = nx.Graph()
-        
-        # Add devices to graph
-        for hostname, config in configs.items():
-            graph.add_node(hostname, config=config)
+        # Index device interfaces in a single pass
+        link_buckets, subnets, vlans, routing_domains = self._index_configs(configs)
         
         # Generate links based on IP addressing
-        links = self._generate_links(configs)
-        
-        # Add links to graph
-        for link in links:
-            graph.add_edge(
-                link.source_device, 
-                link.target_device,
-                bandwidth=link.bandwidth,
-                latency=link.latency,
-                reliability=link.reliability,
-                link_type=link.link_type
-            )
-        
-        # Identify subnets
-        subnets = self._identify_subnets(configs)
-        
-        # Identify VLANs
-        vlans = self._identify_vlans(configs)
-        
-        # Identify routing domains
-        routing_domains = self._identify_routing_domains(configs)
+        links = self._generate_links(link_buckets)
         
-        # Create topology object
+        # Create topology object; the NetworkX graph is only built on demand
         self.topology = NetworkTopology(
             devices=configs,
             links=links,
-            graph=graph,
+            graph=None,
             subnets=subnets,
             vlans=vlans,
             routing_domains=routing_domains
         )
+        self._topology_version += 1
         
         self.logger.info(f"Topology generated with {len(configs)} devices and {len(links)} links")
         return self.topology
     
-    def _generate_links(self, configs: Dict[str, ParsedConfig]) -> List[NetworkLink]:
-        """Generate network links based on IP addressing and subnet analysis"""
-        links = []
+    def _index_configs(self, configs: Dict[str, ParsedConfig]) -> Tuple[
+            List[_LinkBucket], Dict[str, Tuple[str, ...]], Dict[int, Tuple[str, ...]], Dict[str, Tuple[str, ...]]]:
+        """Collect link candidates, subnets, VLANs and routing domains in one pass
+        
+        Link candidates are grouped by subnet (only interfaces sharing a subnet can
+        link); each keeps its scan position so pairs can be visited in scan order.
+        """
+        buckets: Dict[Tuple[int, int], _LinkBucket] = collections.defaultdict(list)
+        # Members are gathered in dicts used as insertion-ordered sets, then frozen to tuples
+        subnets: Dict[str, Dict[str, None]] = collections.defaultdict(dict)
+        vlans: Dict[int, Dict[str, None]] = collections.defaultdict(dict)
+        routing_domains: Dict[str, Dict[str, None]] = collections.defaultdict(dict)
+        position = 0
         
-        # Get all interfaces with IP addresses
-        all_interfaces = []
         for hostname, config in configs.items():
             for interface in config.interfaces:
-                if interface.ip_address and not interface.shutdown:
-                    all_interfaces.append((hostname, interface))
-        
-        # Find potential links based on subnet membership
-        for i, (device1, intf1) in enumerate(all_interfaces):
-            for j, (device2, intf2) in enumerate(all_interfaces[i+1:], i+1):
-                if device1 != device2:
-                    # Check if interfaces are in the same subnet
-                    if self._interfaces_in_same_subnet(intf1, intf2):
-                        link = self._create_link(device1, intf1, device2, intf2)
-                        if link:
-                            links.append(link)
-        
-        # Remove duplicate links (bidirectional)
+                name = interface.name
+                ip_address = interface.ip_address
+                subnet_mask = interface.subnet_mask
+                member = f"{hostname}:{name}"
+                
+                if ip_address and subnet_mask:
+                    try:
+                        network = parse_network_int(ip_address, subnet_mask)
+                    except ValueError as e:
+                        self.logger.warning(f"Error parsing subnet for {member}: {e}")
+                    else:
+                        subnets[_format_network(*network)][member] = None
+                        # Shut down interfaces belong to a subnet but carry no link
+                        if not interface.shutdown:
+                            # Interface type is the name up to the first '/', e.g. GigabitEthernet
+                            intf_type = name.partition('/')[0]
+                            buckets[network].append((position, hostname, interface, intf_type))
+                            position += 1
+                
+                vlan = interface.vlan
+                if vlan:
+                    vlans[vlan][member] = None
+            
+            # Add to routing protocol domains
+            for protocol in config.routing_protocols:
+                routing_domains[protocol][hostname] = None
+            
+            # Check for static routes
+            if config.default_gateway:
+                routing_domains['Static'][hostname] = None
+        
+        # Known, non-empty domains in report order
+        domains = {
+            domain: tuple(routing_domains[domain]) for domain in _ROUTING_DOMAIN_ORDER if domain in routing_domains
+        }
+        
+        return (
+            list(buckets.values()),
+            {subnet: tuple(members) for subnet, members in subnets.items()},
+            {vlan: tuple(members) for vlan, members in vlans.items()},
+            domains
+        )
+    
+    def _generate_links(self, buckets: List[_LinkBucket]) -> List[NetworkLink]:
+        """Generate network links between interfaces of different devices in each subnet"""
+        # Find potential links, visited in interface scan order
+        candidates = []
+        add_candidate = candidates.append
+        for members in buckets:
+            for i, (pos1, device1, intf1, type1) in enumerate(members):
+                for pos2, device2, intf2, type2 in members[i+1:]:
+                    if device1 != device2:
+                        add_candidate((pos1, pos2, device1, intf1, type1, device2, intf2, type2))
+        candidates.sort(key=operator.itemgetter(0, 1))
+        
+        # Create links, removing duplicates (bidirectional): the first link between two
+        # devices fixes the direction, and later links running the opposite way are dropped
         unique_links = []
-        for link in links:
-            duplicate = False
-            for existing_link in unique_links:
-                if (link.source_device == existing_link.target_device and 
-                    link.target_device == existing_link.source_device):
-                    duplicate = True
-                    break
-            if not duplicate:
-                unique_links.append(link)
+        add_link = unique_links.append
+        create_link = self._create_link
+        directions: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        first_direction = directions.setdefault
+        for _, _, device1, intf1, type1, device2, intf2, type2 in candidates:
+            link = create_link(device1, intf1, type1, device2, intf2, type2)
+            if link:
+                direction = (device1, device2)
+                pair = direction if device1 < device2 else (device2, device1)
+                if first_direction(pair, direction) == direction:
+                    add_link(link)
         
         return unique_links
     
-    def _interfaces_in_same_subnet(self, intf1: ParsedInterface, intf2: ParsedInterface) -> bool:
-        """Check if two interfaces are in the same subnet"""
-        try:
-            # Create network objects
-            network1 = ipaddress.IPv4Network(
-                f"{intf1.ip_address}/{intf1.subnet_mask}", 
-                strict=False
-            )
-            network2 = ipaddress.IPv4Network(
-                f"{intf2.ip_address}/{intf2.subnet_mask}", 
-                strict=False
-            )
-            
-            # Check if they're in the same network
-            return network1 == network2
-            
-        except ValueError as e:
-            self.logger.warning(f"Error checking subnet: {e}")
-            return False
-    
-    def _create_link(self, device1: str, intf1: ParsedInterface, 
-                     device2: str, intf2: ParsedInterface) -> Optional[NetworkLink]:
+    def _create_link(self, device1: str, intf1: ParsedInterface, type1: str,
+                     device2: str, intf2: ParsedInterface, type2: str) -> Optional[NetworkLink]:
         """Create a network link between two devices"""
-        try:
-            # Determine link characteristics
-            bandwidth = min(intf1.bandwidth, intf2.bandwidth)
-            
-            # Estimate latency based on link type and distance
-            latency = self._estimate_latency(intf1, intf2)
-            
-            # Estimate reliability
-            reliability = self._estimate_reliability(intf1, intf2)
-            
-            # Determine link type
-            link_type = self._determine_link_type(intf1, intf2)
-            
-            link = NetworkLink(
-                source_device=device1,
-                source_interface=intf1.name,
-                target_device=device2,
-                target_interface=intf2.name,
-                bandwidth=bandwidth,
-                latency=latency,
-                reliability=reliability,
-                link_type=link_type
-            )
-            
-            return link
-            
-        except Exception as e:
-            self.logger.warning(f"Error creating link between {device1} and {device2}: {e}")
+        # Interfaces without a known bandwidth cannot be linked
+        if intf1.bandwidth is None or intf2.bandwidth is None:
+            self.logger.warning(f"Error creating link between {device1} and {device2}: missing bandwidth")
             return None
-    
-    def _estimate_latency(self, intf1: ParsedInterface, intf2: ParsedInterface) -> float:
-        """Estimate link latency in milliseconds"""
-        # Base latency for different interface types
-        base_latencies = {
-            'GigabitEthernet': 0.1,
-            'FastEthernet': 0.5,
-            'Ethernet': 1.0,
-            'Serial': 5.0,
-            'Loopback': 0.01
-        }
         
-        # Get base latency for interface types
-        latency1 = base_latencies.get(intf1.name.split('/')[0], 1.0)
-        latency2 = base_latencies.get(intf2.name.split('/')[0], 1.0)
+        # Determine link characteristics
+        bandwidth = min(intf1.bandwidth, intf2.bandwidth)
         
-        # Return average latency
-        return (latency1 + latency2) / 2
-    
-    def _estimate_reliability(self, intf1: ParsedInterface, intf2: ParsedInterface) -> float:
-        """Estimate link reliability (0.0 to 1.0)"""
-        # Base reliability for different interface types
-        base_reliability = {
-            'GigabitEthernet': 0.9999,
-            'FastEthernet': 0.9995,
-            'Ethernet': 0.9990,
-            'Serial': 0.9980,
-            'Loopback': 1.0
-        }
+        # Estimate latency based on link type and distance
+        latency = self._estimate_latency(type1, type2)
         
-        # Get base reliability for interface types
-        rel1 = base_reliability.get(intf1.name.split('/')[0], 0.9990)
-        rel2 = base_reliability.get(intf2.name.split('/')[0], 0.9990)
+        # Estimate reliability
+        reliability = self._estimate_reliability(type1, type2)
         
-        # Return combined reliability
-        return rel1 * rel2
+        # Determine link type
+        link_type = self._determine_link_type(type1, type2)
+        
+        # Positional construction, in field order
+        return NetworkLink(device1, intf1.name, device2, intf2.name, bandwidth, latency, reliability, link_type)
     
-    def _determine_link_type(self, intf1: ParsedInterface, intf2: ParsedInterface) -> str:
-        """Determine the type of link between interfaces"""
-        intf1_type = intf1.name.split('/')[0]
-        intf2_type = intf2.name.split('/')[0]
-        
-        if 'GigabitEthernet' in [intf1_type, intf2_type]:
-            return 'gigabit_ethernet'
-        elif 'FastEthernet' in [intf1_type, intf2_type]:
-            return 'fast_ethernet'
-        elif 'Serial' in [intf1_type, intf2_type]:
-            return 'serial'
-        elif 'Loopback' in [intf1_type, intf2_type]:
-            return 'loopback'
-        else:
-            return 'ethernet'
+    def _estimate_latency(self, intf1_type: str, intf2_type: str) -> float:
+        """Estimate link latency in milliseconds"""
+        # Average of the base latencies of both interface types
+        return (_BASE_LATENCIES.get(intf1_type, 1.0) + _BASE_LATENCIES.get(intf2_type, 1.0)) / 2
     
-    def _identify_subnets(self, configs: Dict[str, ParsedConfig]) -> Dict[str, List[str]]:
-        """Identify subnets and the devices in each subnet"""
-        subnets = {}
-        
-        for hostname, config in configs.items():
-            for interface in config.interfaces:
-                if interface.ip_address and interface.subnet_mask:
-                    try:
-                        network = ipaddress.IPv4Network(
-                            f"{interface.ip_address}/{interface.subnet_mask}", 
-                            strict=False
-                        )
-                        subnet_key = str(network)
-                        
-                        if subnet_key not in subnets:
-                            subnets[subnet_key] = []
-                        
-                        subnets[subnet_key].append(f"{hostname}:{interface.name}")
-                        
-                    except ValueError as e:
-                        self.logger.warning(f"Error parsing subnet for {hostname}:{interface.name}: {e}")
-        
-        return subnets
+    def _estimate_reliability(self, intf1_type: str, intf2_type: str) -> float:
+        """Estimate link reliability (0.0 to 1.0)"""
+        # Combined reliability of both interface types
+        return _BASE_RELIABILITY.get(intf1_type, 0.9990) * _BASE_RELIABILITY.get(intf2_type, 0.9990)
     
-    def _identify_vlans(self, configs: Dict[str, ParsedConfig]) -> Dict[int, List[str]]:
-        """Identify VLANs and the devices/interfaces in each VLAN"""
-        vlans = {}
-        
-        for hostname, config in configs.items():
-            for interface in config.interfaces:
-                if interface.vlan:
-                    vlan_id = interface.vlan
-                    if vlan_id not in vlans:
-                        vlans[vlan_id] = []
-                    
-                    vlans[vlan_id].append(f"{hostname}:{interface.name}")
-        
-        return vlans
+    def _determine_link_type(self, intf1_type: str, intf2_type: str) -> str:
+        """Determine the type of link between interfaces"""
+        for intf_type, link_type in _LINK_TYPE_PRIORITY:
+            if intf1_type == intf_type or intf2_type == intf_type:
+                return link_type
+        return 'ethernet'
     
-    def _identify_routing_domains(self, configs: Dict[str, ParsedConfig]) -> Dict[str, List[str]]:
-        """Identify routing domains based on routing protocols"""
-        routing_domains = {
-            'OSPF': [],
-            'BGP': [],
-            'EIGRP': [],
-            'RIP': [],
-            'Static': []
-        }
-        
-        for hostname, config in configs.items():
-            # Add to routing protocol domains
-            for protocol in config.routing_protocols:
-                if protocol in routing_domains:
-                    routing_domains[protocol].append(hostname)
-            
-            # Check for static routes
-            if config.default_gateway:
-                routing_domains['Static'].append(hostname)
-        
-        # Remove empty domains
-        routing_domains = {k: v for k, v in routing_domains.items() if v}
-        
-        return routing_domains
+    def _cache_owner(self) -> _CacheOwner:
+        """Identify the current topology state that cached results were computed for"""
+        return (self._topology_version, self.topology, self.topology._revision())
+    
+    def _is_cache_owner(self, owner: Optional[_CacheOwner]) -> bool:
+        """Check whether cached results were computed for the current topology state"""
+        return (owner is not None and owner[0] == self._topology_version and owner[1] is self.topology
+                and owner[2] == self.topology._revision())
     
     def analyze_topology(self) -> Dict[str, Any]:
         """Analyze the generated topology for insights"""
         if not self.topology:
             return {}
         
+        cache = self._analysis_cache
+        if cache is not None and self._is_cache_owner(cache[0]):
+            # Hand out a copy so callers can modify the result without touching the cache
+            return copy.deepcopy(cache[1])
+        
         analysis = {
             'total_devices': len(self.topology.devices),
             'total_links': len(self.topology.links),
@@ -297,55 +440,48 @@ class TopologyGenerator:
             'potential_issues': []
         }
         
-        # Analyze connectivity
-        graph = self.topology.graph
-        
-        # Check if network is connected
-        if nx.is_connected(graph):
-            analysis['connectivity']['status'] = 'Fully Connected'
-            analysis['connectivity']['components'] = 1
-        else:
-            components = list(nx.connected_components(graph))
-            analysis['connectivity']['status'] = f'Disconnected ({len(components)} components)'
-            analysis['connectivity']['components'] = len(components)
+        # Analyze connectivity; one traversal also finds the single points of failure
+        hostnames, _, neighbor_ids = self.topology._indexed_adjacency()
+        articulation_points, components = _scan_connectivity(hostnames, neighbor_ids)
+        analysis['connectivity']['status'] = (
+            'Fully Connected' if components == 1 else f'Disconnected ({components} components)'
+        )
+        analysis['connectivity']['components'] = components
         
         # Analyze bandwidth
-        total_bandwidth = sum(link.bandwidth for link in self.topology.links)
+        total_bandwidth, distribution = self._analyze_bandwidth_distribution()
         avg_bandwidth = total_bandwidth / len(self.topology.links) if self.topology.links else 0
         
         analysis['bandwidth_analysis'] = {
             'total_bandwidth_mbps': total_bandwidth,
             'average_bandwidth_mbps': avg_bandwidth,
-            'bandwidth_distribution': self._analyze_bandwidth_distribution()
+            'bandwidth_distribution': distribution
         }
         
         # Identify potential issues
-        analysis['potential_issues'] = self._identify_potential_issues()
+        analysis['potential_issues'] = self._identify_potential_issues(articulation_points)
         
-        return analysis
+        self._analysis_cache = (self._cache_owner(), analysis)
+        return copy.deepcopy(analysis)
     
-    def _analyze_bandwidth_distribution(self) -> Dict[str, int]:
-        """Analyze bandwidth distribution across links"""
-        distribution = {
-            'low': 0,      # < 100 Mbps
-            'medium': 0,   # 100 Mbps - 1 Gbps
-            'high': 0,     # 1 Gbps - 10 Gbps
-            'ultra': 0     # > 10 Gbps
-        }
+    def _analyze_bandwidth_distribution(self) -> Tuple[int, Dict[str, int]]:
+        """Total link bandwidth and its distribution across links"""
+        bandwidths = self.topology.link_bandwidths
+        distribution = {'low': 0, 'medium': 0, 'high': 0, 'ultra': 0}
         
-        for link in self.topology.links:
-            if link.bandwidth < 100:
+        for bandwidth in bandwidths:
+            if bandwidth < 100:  # < 100 Mbps
                 distribution['low'] += 1
-            elif link.bandwidth < 1000:
+            elif bandwidth < 1000:  # 100 Mbps - 1 Gbps
                 distribution['medium'] += 1
-            elif link.bandwidth < 10000:
+            elif bandwidth < 10000:  # 1 Gbps - 10 Gbps
                 distribution['high'] += 1
-            else:
+            else:  # >= 10 Gbps
                 distribution['ultra'] += 1
         
-        return distribution
+        return sum(bandwidths), distribution
     
-    def _identify_potential_issues(self) -> List[str]:
+    def _identify_potential_issues(self, articulation_points: List[str]) -> List[str]:
         """Identify potential network issues"""
         issues = []
         
@@ -353,8 +489,6 @@ class TopologyGenerator:
             return issues
         
         # Check for single points of failure
-        graph = self.topology.graph
-        articulation_points = list(nx.articulation_points(graph))
         if articulation_points:
             issues.append(f"Single points of failure detected: {', '.join(articulation_points)}")
         
@@ -364,8 +498,8 @@ class TopologyGenerator:
             issues.append(f"Low bandwidth links detected: {len(low_bandwidth_links)} links < 100 Mbps")
         
         # Check for isolated devices
-        isolated_nodes = [node for node in self.topology.graph.nodes() 
-                         if self.topology.graph.degree(node) == 0]
+        isolated_nodes = [node for node, neighbors in self.topology.adjacency.items() 
+                         if not neighbors]
         if isolated_nodes:
             issues.append(f"Isolated devices detected: {', '.join(isolated_nodes)}")
         
@@ -382,11 +516,18 @@ class TopologyGenerator:
             self.logger.error("No topology to export")
             return
         
-        import json
+        topology = self.topology
         
-        export_data = {
-            'devices': {
-                hostname: {
+        # Stream one compact record per line instead of building and indenting one big document
+        encode = json.JSONEncoder().encode
+        with open(output_file, 'w') as f:
+            f.write('{"devices": {')
+            separator = '\n'
+            for hostname, config in topology.devices.items():
+                f.write(separator)
+                f.write(encode(hostname))
+                f.write(': ')
+                f.write(encode({
                     'hostname': config.hostname,
                     'interfaces': [
                         {
@@ -400,11 +541,13 @@ class TopologyGenerator:
                         for intf in config.interfaces
                     ],
                     'routing_protocols': config.routing_protocols
-                }
-                for hostname, config in self.topology.devices.items()
-            },
-            'links': [
-                {
+                }))
+                separator = ',\n'
+            f.write('\n},\n"links": [')
+            separator = '\n'
+            for link in topology.links:
+                f.write(separator)
+                f.write(encode({
                     'source_device': link.source_device,
                     'source_interface': link.source_interface,
                     'target_device': link.target_device,
@@ -413,39 +556,74 @@ class TopologyGenerator:
                     'latency': link.latency,
                     'reliability': link.reliability,
                     'link_type': link.link_type
-                }
-                for link in self.topology.links
-            ],
-            'subnets': self.topology.subnets,
-            'vlans': self.topology.vlans,
-            'routing_domains': self.topology.routing_domains
-        }
-        
-        with open(output_file, 'w') as f:
-            json.dump(export_data, f, indent=2)
+                }))
+                separator = ',\n'
+            f.write('\n],\n"subnets": ')
+            f.write(encode(topology.subnets))
+            f.write(',\n"vlans": ')
+            f.write(encode(topology.vlans))
+            f.write(',\n"routing_domains": ')
+            f.write(encode(topology.routing_domains))
+            f.write('}\n')
         
         self.logger.info(f"Topology exported to {output_file}")
     
+    def _get_path_tree(self, source: str) -> List[int]:
+        """Shortest-path tree from a device over the indexed adjacency, cached per source"""
+        if not self._is_cache_owner(self._path_cache_owner):
+            self._path_cache_owner = self._cache_owner()
+            self._path_trees.clear()
+        
+        trees = self._path_trees
+        parents = trees.get(source)
+        if parents is not None:
+            trees.move_to_end(source)
+            return parents
+        
+        _, host_ids, neighbor_ids = self.topology._indexed_adjacency()
+        if source not in host_ids:
+            raise nx.NodeNotFound(f"Source {source} is not in G")
+        parents = _bfs_parents(neighbor_ids, host_ids[source])
+        trees[source] = parents
+        if len(trees) > _PATH_TREE_CACHE_SIZE:
+            trees.popitem(last=False)
+        return parents
+    
     def get_shortest_path(self, source: str, target: str) -> Optional[List[str]]:
         """Get shortest path between two devices"""
         if not self.topology:
             return None
         
-        try:
-            path = nx.shortest_path(self.topology.graph, source, target)
-            return path
-        except nx.NetworkXNoPath:
+        # One search from the source answers every target, so paths to all of them are cached
+        parents = self._get_path_tree(source)
+        hostnames, host_ids, _ = self.topology._indexed_adjacency()
+        if target not in host_ids:
+            raise nx.NodeNotFound(f"Target {target} is not in G")
+        
+        node = host_ids[target]
+        if parents[node] == _UNREACHED:
             self.logger.warning(f"No path found between {source} and {target}")
             return None
+        path = []
+        while node != -1:
+            path.append(hostnames[node])
+            node = parents[node]
+        path.reverse()
+        return path
+    
+    def precompute_paths(self, source: str):
+        """Cache shortest paths from a device to every device reachable from it"""
+        if not self.topology:
+            return
+        
+        self._get_path_tree(source)
     
     def get_device_neighbors(self, device: str) -> List[str]:
         """Get list of neighboring devices"""
         if not self.topology:
             return []
         
-        if device in self.topology.graph:
-            return list(self.topology.graph.neighbors(device))
-        return []
+        return list(self.topology.adjacency.get(device, ()))
 
 # Example usage
 if __name__ == "__main__":
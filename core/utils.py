@@ -1,12 +1,148 @@
 import os
 import json
+import concurrent.futures
 import logging
 import ipaddress
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 from datetime import datetime
 import hashlib
+import heapq
 import re
+import socket
+import fnmatch
+import string
 import time
+from functools import lru_cache
+
+# Distinct addresses and (ip, mask) pairs whose parsed form is remembered
+_PARSE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def parse_ipv4_address(address: str) -> ipaddress.IPv4Address:
+    """Parse an IPv4 address or mask; raises AddressValueError if invalid"""
+    return ipaddress.IPv4Address(address)
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_network(ip_address: str, subnet_mask: str) -> ipaddress.IPv4Network:
+    """Parse the network an address belongs to; raises ValueError if invalid"""
+    return ipaddress.IPv4Network(f"{ip_address}/{subnet_mask}", strict=False)
+
+def _parse_ipv4(ip_string: str) -> int:
+    """Parse a dotted-quad IPv4 address to an int; raises ValueError if invalid"""
+    # inet_pton is as strict as ipaddress (four decimal octets, no leading zeros)
+    # but parses in C without building an address object
+    try:
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, ip_string), 'big')
+    except (OSError, TypeError) as e:
+        raise ValueError(f"Invalid IPv4 address: {ip_string!r}") from e
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _is_ip(ip_string: str) -> bool:
+    """Check if a string is a valid IPv4 or IPv6 address"""
+    try:
+        _parse_ipv4(ip_string)
+        return True
+    except ValueError:
+        pass
+    try:
+        ipaddress.ip_address(ip_string)
+        return True
+    except ValueError:
+        return False
+
+def mask_prefix_length(mask_int: int) -> Optional[int]:
+    """Prefix length of a 32-bit netmask, or None if its 1s are not contiguous"""
+    # All 1s followed by all 0s: the inverted mask is 2**k - 1,
+    # so adding one clears every bit it has set
+    inverted = ~mask_int & 0xFFFFFFFF
+    if inverted & (inverted + 1):
+        return None
+    # The host part is exactly the low bits of the inverted mask
+    return 32 - inverted.bit_length()
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def parse_network_int(ip_address: str, subnet_mask: str) -> Tuple[int, int]:
+    """Parse the network an address belongs to as (network int, prefix length)
+    
+    Dotted-quad address/netmask pairs are handled with integer arithmetic; anything
+    else goes through ipaddress, which raises ValueError if invalid.
+    """
+    try:
+        address = _parse_ipv4(ip_address)
+        mask = _parse_ipv4(subnet_mask)
+    except ValueError:
+        pass
+    else:
+        prefix = mask_prefix_length(mask)
+        if prefix is not None:
+            return address & mask, prefix
+    network = ipaddress.IPv4Network(f"{ip_address}/{subnet_mask}", strict=False)
+    return int(network.network_address), network.prefixlen
+
+# Signal propagation speed by link type (km/s): ~200,000 in fiber, ~300,000 in air;
+# other link types are treated as fiber
+_SIGNAL_SPEED_KM_S = {'fiber': 200000, 'wireless': 300000}
+_DEFAULT_SIGNAL_SPEED_KM_S = 200000
+# Base processing delay added to every link (seconds)
+_PROCESSING_DELAY_S = 0.001
+
+def _zip_equal(first: List[Any], second: List[Any]):
+    """Pair up two lists, raising ValueError if their lengths differ"""
+    # Stands in for zip(..., strict=True), which needs Python 3.10
+    if len(first) != len(second):
+        raise ValueError(f"Length mismatch: {len(first)} != {len(second)}")
+    return zip(first, second)
+
+# Inclusive bounds accepted by the VLAN ID and MTU validators
+_VLAN_ID_MIN, _VLAN_ID_MAX = 1, 4094
+_MTU_MIN, _MTU_MAX = 68, 9000
+# Bandwidth must be strictly greater than this
+_BANDWIDTH_MIN_EXCLUSIVE = 0
+
+# Characters allowed in a hostname
+_HOSTNAME_CHARS = frozenset(string.ascii_letters + string.digits + '-')
+
+# Bytes read per chunk when hashing a file
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+def _new_file_hash():
+    """Hash object used for file digests: BLAKE2b truncated to 128 bits"""
+    return hashlib.blake2b(digest_size=16)
+
+def _iter_files(directory: str):
+    """Yield (name, path) of files under a directory, top-down like os.walk
+    
+    Uses os.scandir so file/directory checks come from the directory entries;
+    unreadable directories are skipped and symlinked directories are not followed.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirectories = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if not entry.is_symlink():
+                subdirectories.append(entry.path)
+        else:
+            yield entry.name, entry.path
+    
+    for subdirectory in subdirectories:
+        yield from _iter_files(subdirectory)
+
+def _iter_config_files(directory: str, pattern: str):
+    """Yield paths of configuration files under a directory"""
+    # Pattern is a shell-style glob such as "*.dump"
+    matches_pattern = re.compile(fnmatch.translate(pattern)).match
+    for name, path in _iter_files(directory):
+        if name.endswith('.dump') or matches_pattern(name):
+            yield path
 
 class NetworkUtils:
     """Utility functions for network operations"""
@@ -15,38 +151,31 @@ class NetworkUtils:
     def is_valid_ip(ip_string: str) -> bool:
         """Check if a string is a valid IP address"""
         try:
-            ipaddress.ip_address(ip_string)
-            return True
-        except ValueError:
+            return _is_ip(ip_string)
+        except TypeError:  # unhashable input cannot be a cache key
             return False
     
     @staticmethod
     def is_valid_subnet_mask(mask_string: str) -> bool:
         """Check if a string is a valid subnet mask"""
         try:
-            mask = ipaddress.IPv4Address(mask_string)
-            mask_int = int(mask)
-            
-            # Convert to binary and check if it's a valid subnet mask
-            binary = bin(mask_int)[2:].zfill(32)
-            
-            # Check if it's all 1s followed by all 0s
-            found_zero = False
-            for bit in binary:
-                if bit == '0':
-                    found_zero = True
-                elif found_zero and bit == '1':
-                    return False
-            
-            return True
+            return mask_prefix_length(_parse_ipv4(mask_string)) is not None
         except ValueError:
             return False
     
+    @staticmethod
+    def get_prefix_length(mask_string: str) -> Optional[int]:
+        """Get the prefix length of a subnet mask, or None if it is not a valid mask"""
+        try:
+            return mask_prefix_length(_parse_ipv4(mask_string))
+        except ValueError:
+            return None
+    
     @staticmethod
     def get_network_address(ip_address: str, subnet_mask: str) -> str:
         """Get network address from IP and subnet mask"""
         try:
-            network = ipaddress.IPv4Network(f"{ip_address}/{subnet_mask}", strict=False)
+            network = _parse_network(ip_address, subnet_mask)
             return str(network.network_address)
         except ValueError:
             return ""
@@ -55,7 +184,7 @@ class NetworkUtils:
     def get_broadcast_address(ip_address: str, subnet_mask: str) -> str:
         """Get broadcast address from IP and subnet mask"""
         try:
-            network = ipaddress.IPv4Network(f"{ip_address}/{subnet_mask}", strict=False)
+            network = _parse_network(ip_address, subnet_mask)
             return str(network.broadcast_address)
         except ValueError:
             return ""
@@ -64,7 +193,7 @@ class NetworkUtils:
     def get_usable_hosts(ip_address: str, subnet_mask: str) -> int:
         """Get number of usable hosts in a subnet"""
         try:
-            network = ipaddress.IPv4Network(f"{ip_address}/{subnet_mask}", strict=False)
+            network = _parse_network(ip_address, subnet_mask)
             return network.num_addresses - 2  # Subtract network and broadcast
         except ValueError:
             return 0
@@ -73,8 +202,8 @@ class NetworkUtils:
     def is_same_subnet(ip1: str, mask1: str, ip2: str, mask2: str) -> bool:
         """Check if two IP addresses are in the same subnet"""
         try:
-            network1 = ipaddress.IPv4Network(f"{ip1}/{mask1}", strict=False)
-            network2 = ipaddress.IPv4Network(f"{ip2}/{mask2}", strict=False)
+            network1 = _parse_network(ip1, mask1)
+            network2 = _parse_network(ip2, mask2)
             return network1 == network2
         except ValueError:
             return False
@@ -86,26 +215,30 @@ class NetworkUtils:
             return 0.0
         return (current_usage / capacity) * 100
     
+    @staticmethod
+    def calculate_bandwidth_utilizations(current_usages: List[int], capacities: List[int]) -> List[float]:
+        """Calculate bandwidth utilization percentages for many links at once"""
+        utilization = NetworkUtils.calculate_bandwidth_utilization
+        return [
+            utilization(current_usage, capacity)
+            for current_usage, capacity in _zip_equal(current_usages, capacities)
+        ]
+    
     @staticmethod
     def estimate_latency(distance_km: float, link_type: str) -> float:
         """Estimate latency based on distance and link type"""
-        # Speed of light in fiber: ~200,000 km/s
-        # Speed of light in air: ~300,000 km/s
-        
-        if link_type == 'fiber':
-            speed = 200000  # km/s
-        elif link_type == 'wireless':
-            speed = 300000  # km/s
-        else:
-            speed = 200000  # Default to fiber
-        
-        # Calculate propagation delay
-        propagation_delay = distance_km / speed
-        
-        # Add processing delays
-        processing_delay = 0.001  # 1ms base processing delay
-        
-        return (propagation_delay + processing_delay) * 1000  # Convert to milliseconds
+        # Propagation delay plus processing delay, in milliseconds
+        speed = _SIGNAL_SPEED_KM_S.get(link_type, _DEFAULT_SIGNAL_SPEED_KM_S)
+        return (distance_km / speed + _PROCESSING_DELAY_S) * 1000
+    
+    @staticmethod
+    def estimate_latency_batch(distances_km: List[float], link_types: List[str]) -> List[float]:
+        """Estimate latencies for many links at once, pairing distances with link types"""
+        estimate = NetworkUtils.estimate_latency
+        return [
+            estimate(distance_km, link_type)
+            for distance_km, link_type in _zip_equal(distances_km, link_types)
+        ]
 
 class FileUtils:
     """Utility functions for file operations"""
@@ -122,21 +255,38 @@ class FileUtils:
     @staticmethod
     def safe_write_json(data: Any, file_path: str, backup: bool = True) -> bool:
         """Safely write JSON data to a file with optional backup"""
+        # Write to a temporary file first so a failed dump never clobbers the original
+        tmp_path = f"{file_path}.tmp"
         try:
+            # Encode in one shot and write the bytes with a single call
+            payload = json.dumps(data, indent=2).encode('utf-8')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            
             # Create backup if requested
             if backup and os.path.exists(file_path):
-                backup_path = f"{file_path}.backup"
-                os.rename(file_path, backup_path)
-            
-            # Write new data
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+                os.replace(file_path, f"{file_path}.backup")
             
+            os.replace(tmp_path, file_path)
             return True
         except Exception as e:
             logging.error(f"Error writing JSON file {file_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False
     
+    @staticmethod
+    def safe_write_json_batch(items: List[Tuple[str, Any]], backup: bool = True) -> Dict[str, bool]:
+        """Write many JSON files (distinct paths) concurrently; returns success per path"""
+        # Writes are I/O bound and release the GIL, so threads overlap the syscalls
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            results = executor.map(
+                lambda item: FileUtils.safe_write_json(item[1], item[0], backup), items
+            )
+            return {file_path: ok for (file_path, _), ok in zip(items, results)}
+    
     @staticmethod
     def safe_read_json(file_path: str) -> Optional[Any]:
         """Safely read JSON data from a file"""
@@ -144,8 +294,9 @@ class FileUtils:
             if not os.path.exists(file_path):
                 return None
             
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            # json accepts raw bytes, which skips the text-layer decode
+            with open(file_path, 'rb') as f:
+                return json.loads(f.read())
         except Exception as e:
             logging.error(f"Error reading JSON file {file_path}: {e}")
             return None
@@ -156,10 +307,7 @@ class FileUtils:
         config_files = []
         
         try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if file.endswith('.dump') or re.match(pattern, file):
-                        config_files.append(os.path.join(root, file))
+            config_files.extend(_iter_config_files(directory, pattern))
         except Exception as e:
             logging.error(f"Error searching for config files: {e}")
         
@@ -167,16 +315,36 @@ class FileUtils:
     
     @staticmethod
     def get_file_hash(file_path: str) -> Optional[str]:
-        """Calculate MD5 hash of a file"""
+        """Calculate a 128-bit BLAKE2b hash of a file, as 32 hex characters"""
         try:
-            hash_md5 = hashlib.md5()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                try:
+                    # Python 3.11+: hashes straight from the file buffer without Python-level reads
+                    digest = hashlib.file_digest(f, _new_file_hash)
+                except AttributeError:
+                    # Python < 3.11: reuse one buffer instead of allocating a bytes object per chunk
+                    digest = _new_file_hash()
+                    buffer = memoryview(bytearray(_HASH_CHUNK_SIZE))
+                    while size := f.readinto(buffer):
+                        digest.update(buffer[:size])
+            return digest.hexdigest()
         except Exception as e:
             logging.error(f"Error calculating file hash: {e}")
             return None
+    
+    @staticmethod
+    def get_file_hashes(file_paths: List[str]) -> Dict[str, Optional[str]]:
+        """Calculate hashes of many files concurrently, keyed by path"""
+        # hashlib releases the GIL while hashing, so threads overlap reads and digests
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            return dict(zip(file_paths, executor.map(FileUtils.get_file_hash, file_paths)))
+    
+    @staticmethod
+    def iter_config_hashes(directory: str, pattern: str = "*.dump") -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield (path, hash) for each configuration file as the directory is walked"""
+        # Hash each file right after its directory entry is read, in a single traversal
+        for file_path in _iter_config_files(directory, pattern):
+            yield file_path, FileUtils.get_file_hash(file_path)
 
 class LogUtils:
     """Utility functions for logging"""
@@ -209,16 +377,21 @@ class LogUtils:
     def log_function_call(func_name: str, args: tuple, kwargs: dict, 
                          logger: logging.Logger) -> None:
         """Log function call details"""
-        logger.debug(f"Function call: {func_name}")
-        logger.debug(f"Arguments: {args}")
-        logger.debug(f"Keyword arguments: {kwargs}")
+        # Skip building the argument reprs entirely when debug output is off
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Function call: %s", func_name)
+        logger.debug("Arguments: %s", args)
+        logger.debug("Keyword arguments: %s", kwargs)
     
     @staticmethod
     def log_performance(func_name: str, start_time: float, 
                        logger: logging.Logger) -> None:
-        """Log function performance"""
-        execution_time = time.time() - start_time
-        logger.info(f"Function {func_name} executed in {execution_time:.4f} seconds")
+        """Log function performance; start_time must come from time.perf_counter()"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        execution_time = time.perf_counter() - start_time
+        logger.info("Function %s executed in %.4f seconds", func_name, execution_time)
 
 class ValidationUtils:
     """Utility functions for validation"""
@@ -227,8 +400,8 @@ class ValidationUtils:
     def validate_ip_range(start_ip: str, end_ip: str) -> bool:
         """Validate that start IP is less than end IP"""
         try:
-            start = ipaddress.IPv4Address(start_ip)
-            end = ipaddress.IPv4Address(end_ip)
+            start = _parse_ipv4(start_ip)
+            end = _parse_ipv4(end_ip)
             return start < end
         except ValueError:
             return False
@@ -236,17 +409,32 @@ class ValidationUtils:
     @staticmethod
     def validate_vlan_id(vlan_id: int) -> bool:
         """Validate VLAN ID (1-4094)"""
-        return 1 <= vlan_id <= 4094
+        return _VLAN_ID_MIN <= vlan_id <= _VLAN_ID_MAX
     
     @staticmethod
     def validate_mtu(mtu: int) -> bool:
         """Validate MTU size (68-9000)"""
-        return 68 <= mtu <= 9000
+        return _MTU_MIN <= mtu <= _MTU_MAX
     
     @staticmethod
     def validate_bandwidth(bandwidth: int) -> bool:
         """Validate bandwidth value (positive integer)"""
-        return bandwidth > 0
+        return bandwidth > _BANDWIDTH_MIN_EXCLUSIVE
+    
+    @staticmethod
+    def validate_vlan_ids(vlan_ids: List[int]) -> List[bool]:
+        """Validate many VLAN IDs in one call"""
+        return [_VLAN_ID_MIN <= vlan_id <= _VLAN_ID_MAX for vlan_id in vlan_ids]
+    
+    @staticmethod
+    def validate_mtus(mtus: List[int]) -> List[bool]:
+        """Validate many MTU sizes in one call"""
+        return [_MTU_MIN <= mtu <= _MTU_MAX for mtu in mtus]
+    
+    @staticmethod
+    def validate_bandwidths(bandwidths: List[int]) -> List[bool]:
+        """Validate many bandwidth values in one call"""
+        return [bandwidth > _BANDWIDTH_MIN_EXCLUSIVE for bandwidth in bandwidths]
     
     @staticmethod
     def validate_hostname(hostname: str) -> bool:
@@ -256,8 +444,7 @@ class ValidationUtils:
             return False
         
         # Check for valid characters
-        valid_chars = re.compile(r'^[a-zA-Z0-9\-]+$')
-        return bool(valid_chars.match(hostname))
+        return _HOSTNAME_CHARS.issuperset(hostname)
 
 class NetworkAnalysis:
     """Network analysis utilities"""
@@ -265,22 +452,38 @@ class NetworkAnalysis:
     @staticmethod
     def analyze_subnet_overlap(subnets: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """Analyze subnet configurations for overlaps"""
-        overlaps = []
+        # CIDR blocks are either nested or disjoint, so sweep them by start address
+        # (larger blocks first): every block still open on the stack contains the next one
+        blocks = []
+        for index, subnet in enumerate(subnets):
+            try:
+                network = _parse_network(subnet['ip'], subnet['mask'])
+            except ValueError:
+                continue
+            start = int(network.network_address)
+            blocks.append((start, -network.num_addresses, index, start + network.num_addresses - 1))
+        blocks.sort()
         
-        for i, subnet1 in enumerate(subnets):
-            for j, subnet2 in enumerate(subnets[i+1:], i+1):
-                try:
-                    net1 = ipaddress.IPv4Network(f"{subnet1['ip']}/{subnet1['mask']}", strict=False)
-                    net2 = ipaddress.IPv4Network(f"{subnet2['ip']}/{subnet2['mask']}", strict=False)
-                    
-                    if net1.overlaps(net2):
-                        overlaps.append({
-                            'subnet1': subnet1,
-                            'subnet2': subnet2,
-                            'overlap_type': 'full' if net1 == net2 else 'partial'
-                        })
-                except ValueError:
-                    continue
+        pairs = []
+        open_blocks = []
+        for start, neg_size, index, end in blocks:
+            while open_blocks and open_blocks[-1][0] < start:
+                open_blocks.pop()
+            for _, outer_start, outer_neg_size, outer_index in open_blocks:
+                full = outer_start == start and outer_neg_size == neg_size
+                pairs.append((min(index, outer_index), max(index, outer_index), full))
+            open_blocks.append((end, start, neg_size, index))
+        
+        # Report pairs in input order, as a pairwise scan would
+        pairs.sort()
+        overlaps = [
+            {
+                'subnet1': subnets[i],
+                'subnet2': subnets[j],
+                'overlap_type': 'full' if full else 'partial'
+            }
+            for i, j, full in pairs
+        ]
         
         return overlaps
     
@@ -298,16 +501,25 @@ class NetworkAnalysis:
         
         return min(efficiency, 1.0)  # Cap at 100%
     
+    @staticmethod
+    def calculate_network_efficiencies(device_counts: List[int], link_counts: List[int]) -> List[float]:
+        """Calculate network efficiency for many device/link count pairs at once"""
+        efficiency = NetworkAnalysis.calculate_network_efficiency
+        return [
+            efficiency(devices, links)
+            for devices, links in _zip_equal(device_counts, link_counts)
+        ]
+    
     @staticmethod
     def identify_bottlenecks(links: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Identify potential network bottlenecks"""
         bottlenecks = []
         
-        # Sort links by bandwidth
-        sorted_links = sorted(links, key=lambda x: x.get('bandwidth', 0))
+        # Only the three lowest-bandwidth links matter, so avoid sorting them all
+        lowest_links = heapq.nsmallest(3, links, key=lambda x: x.get('bandwidth', 0))
         
         # Identify low bandwidth links
-        for link in sorted_links[:3]:  # Top 3 lowest bandwidth
+        for link in lowest_links:
             if link.get('bandwidth', 0) < 100:  # Less than 100 Mbps
                 bottlenecks.append({
                     'type': 'low_bandwidth',
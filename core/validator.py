@@ -1,9 +1,11 @@
 import ipaddress
 import logging
+from collections import defaultdict
 from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass
 from .config_parser import ParsedConfig, ParsedInterface
 from .topology_generator import NetworkTopology, NetworkLink
+from .utils import mask_prefix_length, parse_ipv4_address, parse_network_int
 import networkx as nx
 
 @dataclass
@@ -38,11 +40,20 @@ class NetworkValidator:
         self.issues = []
         self.recommendations = []
         
+        # Flatten every interface into one row up front so the checks below share a
+        # single traversal: (hostname, name, ip_address, subnet_mask, vlan, mtu)
+        interface_rows = [
+            (hostname, interface.name, interface.ip_address, interface.subnet_mask,
+             interface.vlan, interface.mtu)
+            for hostname, config in topology.devices.items()
+            for interface in config.interfaces
+        ]
+        
         # Perform various validation checks
-        self._validate_ip_configurations(topology)
-        self._validate_vlan_configurations(topology)
+        self._validate_ip_configurations(topology, interface_rows)
+        self._validate_vlan_configurations(topology, interface_rows)
         self._validate_routing_configurations(topology)
-        self._validate_performance_configurations(topology)
+        self._validate_performance_configurations(topology, interface_rows)
         self._validate_security_configurations(topology)
         self._validate_network_redundancy(topology)
         
@@ -53,122 +64,116 @@ class NetworkValidator:
         
         return self.issues, self.recommendations
     
-    def _validate_ip_configurations(self, topology: NetworkTopology):
+    def _validate_ip_configurations(self, topology: NetworkTopology, interface_rows: List[tuple]):
         """Validate IP addressing configurations"""
         self.logger.info("Validating IP configurations...")
         
-        # Check for duplicate IP addresses
+        # All four checks run in one pass over the interfaces; each keeps its own
+        # issue list so the report order matches running them one after another
+        duplicate_issues = []
+        address_issues = []
+        mask_issues = []
+        overlap_issues = []
         ip_addresses = {}
-        for hostname, config in topology.devices.items():
-            for interface in config.interfaces:
-                if interface.ip_address:
-                    if interface.ip_address in ip_addresses:
-                        self.issues.append(ValidationIssue(
-                            severity='error',
-                            category='ip',
-                            message=f"Duplicate IP address {interface.ip_address}",
-                            affected_devices=[hostname, ip_addresses[interface.ip_address]['device']],
-                            affected_interfaces=[interface.name, ip_addresses[interface.ip_address]['interface']],
-                            recommendation="Ensure each interface has a unique IP address"
-                        ))
-                    else:
-                        ip_addresses[interface.ip_address] = {
-                            'device': hostname,
-                            'interface': interface.name
-                        }
-        
-        # Check for invalid IP addresses
-        for hostname, config in topology.devices.items():
-            for interface in config.interfaces:
-                if interface.ip_address:
-                    try:
-                        ipaddress.IPv4Address(interface.ip_address)
-                    except ipaddress.AddressValueError:
-                        self.issues.append(ValidationIssue(
-                            severity='error',
-                            category='ip',
-                            message=f"Invalid IP address format: {interface.ip_address}",
-                            affected_devices=[hostname],
-                            affected_interfaces=[interface.name],
-                            recommendation="Use valid IPv4 address format (e.g., 192.168.1.1)"
-                        ))
-        
-        # Check for subnet mask issues
-        for hostname, config in topology.devices.items():
-            for interface in config.interfaces:
-                if interface.subnet_mask:
-                    try:
-                        mask = ipaddress.IPv4Address(interface.subnet_mask)
-                        # Check if it's a valid subnet mask
-                        mask_int = int(mask)
-                        if not self._is_valid_subnet_mask(mask_int):
-                            self.issues.append(ValidationIssue(
-                                severity='warning',
-                                category='ip',
-                                message=f"Questionable subnet mask: {interface.subnet_mask}",
-                                affected_devices=[hostname],
-                                affected_interfaces=[interface.name],
-                                recommendation="Verify subnet mask is appropriate for network size"
-                            ))
-                    except ipaddress.AddressValueError:
-                        self.issues.append(ValidationIssue(
-                            severity='error',
+        networks = {}
+        for hostname, interface_name, ip_address, subnet_mask, _, _ in interface_rows:
+            # Check for duplicate and invalid IP addresses
+            valid_address = False
+            if ip_address:
+                if ip_address in ip_addresses:
+                    duplicate_issues.append(ValidationIssue(
+                        severity='error',
+                        category='ip',
+                        message=f"Duplicate IP address {ip_address}",
+                        affected_devices=[hostname, ip_addresses[ip_address]['device']],
+                        affected_interfaces=[interface_name, ip_addresses[ip_address]['interface']],
+                        recommendation="Ensure each interface has a unique IP address"
+                    ))
+                else:
+                    ip_addresses[ip_address] = {
+                        'device': hostname,
+                        'interface': interface_name
+                    }
+                
+                try:
+                    parse_ipv4_address(ip_address)
+                    valid_address = True
+                except ipaddress.AddressValueError:
+                    address_issues.append(ValidationIssue(
+                        severity='error',
+                        category='ip',
+                        message=f"Invalid IP address format: {ip_address}",
+                        affected_devices=[hostname],
+                        affected_interfaces=[interface_name],
+                        recommendation="Use valid IPv4 address format (e.g., 192.168.1.1)"
+                    ))
+            
+            # Check for subnet mask issues
+            if subnet_mask:
+                try:
+                    mask_int = int(parse_ipv4_address(subnet_mask))
+                    # Check if it's a valid subnet mask
+                    if not self._is_valid_subnet_mask(mask_int):
+                        mask_issues.append(ValidationIssue(
+                            severity='warning',
                             category='ip',
-                            message=f"Invalid subnet mask format: {interface.subnet_mask}",
+                            message=f"Questionable subnet mask: {subnet_mask}",
                             affected_devices=[hostname],
-                            affected_interfaces=[interface.name],
-                            recommendation="Use valid subnet mask format (e.g., 255.255.255.0)"
+                            affected_interfaces=[interface_name],
+                            recommendation="Verify subnet mask is appropriate for network size"
                         ))
+                except ipaddress.AddressValueError:
+                    mask_issues.append(ValidationIssue(
+                        severity='error',
+                        category='ip',
+                        message=f"Invalid subnet mask format: {subnet_mask}",
+                        affected_devices=[hostname],
+                        affected_interfaces=[interface_name],
+                        recommendation="Use valid subnet mask format (e.g., 255.255.255.0)"
+                    ))
+            
+            # Check for network overlap; an address that failed to parse
+            # above cannot form a network either
+            if valid_address and subnet_mask:
+                try:
+                    # Key by (network int, prefix length) rather than formatting the network
+                    network_key = parse_network_int(ip_address, subnet_mask)
+                except ValueError:
+                    continue
+                
+                if network_key in networks:
+                    # Equal keys are the same network, which always overlaps itself
+                    overlap_issues.append(ValidationIssue(
+                        severity='warning',
+                        category='ip',
+                        message=f"Potential network overlap detected",
+                        affected_devices=[hostname, networks[network_key]['device']],
+                        affected_interfaces=[interface_name, networks[network_key]['interface']],
+                        recommendation="Review network addressing plan to avoid overlaps"
+                    ))
+                else:
+                    networks[network_key] = {
+                        'device': hostname,
+                        'interface': interface_name
+                    }
         
-        # Check for network overlap
-        networks = {}
-        for hostname, config in topology.devices.items():
-            for interface in config.interfaces:
-                if interface.ip_address and interface.subnet_mask:
-                    try:
-                        network = ipaddress.IPv4Network(
-                            f"{interface.ip_address}/{interface.subnet_mask}", 
-                            strict=False
-                        )
-                        network_key = str(network)
-                        
-                        if network_key in networks:
-                            # Check if networks overlap
-                            existing_network = networks[network_key]['network']
-                            if network.overlaps(existing_network):
-                                self.issues.append(ValidationIssue(
-                                    severity='warning',
-                                    category='ip',
-                                    message=f"Potential network overlap detected",
-                                    affected_devices=[hostname, networks[network_key]['device']],
-                                    affected_interfaces=[interface.name, networks[network_key]['interface']],
-                                    recommendation="Review network addressing plan to avoid overlaps"
-                                ))
-                        else:
-                            networks[network_key] = {
-                                'network': network,
-                                'device': hostname,
-                                'interface': interface.name
-                            }
-                    except ValueError:
-                        continue
+        self.issues.extend(duplicate_issues)
+        self.issues.extend(address_issues)
+        self.issues.extend(mask_issues)
+        self.issues.extend(overlap_issues)
     
-    def _validate_vlan_configurations(self, topology: NetworkTopology):
+    def _validate_vlan_configurations(self, topology: NetworkTopology, interface_rows: List[tuple]):
         """Validate VLAN configurations"""
         self.logger.info("Validating VLAN configurations...")
         
         # Check for VLAN consistency
-        vlan_interfaces = {}
-        for hostname, config in topology.devices.items():
-            for interface in config.interfaces:
-                if interface.vlan:
-                    vlan_id = interface.vlan
-                    if vlan_id not in vlan_interfaces:
-                        vlan_interfaces[vlan_id] = []
-                    vlan_interfaces[vlan_id].append({
-                        'device': hostname,
-                        'interface': interface.name
-                    })
+        vlan_interfaces = defaultdict(list)
+        for hostname, interface_name, _, _, vlan_id, _ in interface_rows:
+            if vlan_id:
+                vlan_interfaces[vlan_id].append({
+                    'device': hostname,
+                    'interface': interface_name
+                })
         
         # Check for VLANs with only one interface
         for vlan_id, interfaces in vlan_interfaces.items():
@@ -202,15 +207,16 @@ class NetworkValidator:
         """Validate routing configurations"""
         self.logger.info("Validating routing configurations...")
         
-        # Check for routing protocol conflicts
-        routing_devices = {}
+        # Collect OSPF and BGP devices in the same pass that checks for
+        # multiple protocols on one device
+        ospf_devices = {}
+        bgp_devices = {}
         for hostname, config in topology.devices.items():
             protocols = config.routing_protocols
-            if protocols:
-                routing_devices[hostname] = protocols
-        
-        # Check for multiple protocols on same device
-        for hostname, protocols in routing_devices.items():
+            bgp_asn = config.bgp_asn
+            if not protocols and not bgp_asn:
+                continue
+            
             if len(protocols) > 1:
                 self.issues.append(ValidationIssue(
                     severity='warning',
@@ -220,12 +226,11 @@ class NetworkValidator:
                     affected_interfaces=[],
                     recommendation="Consider using route redistribution or standardizing on one protocol"
                 ))
-        
-        # Check for OSPF area consistency
-        ospf_devices = {}
-        for hostname, config in topology.devices.items():
-            if 'OSPF' in config.routing_protocols:
+            
+            if 'OSPF' in protocols:
                 ospf_devices[hostname] = config.ospf_areas
+            if bgp_asn:
+                bgp_devices[hostname] = bgp_asn
         
         # Check if OSPF areas are consistent across devices
         if len(ospf_devices) > 1:
@@ -245,11 +250,6 @@ class NetworkValidator:
                     ))
         
         # Check for BGP ASN consistency
-        bgp_devices = {}
-        for hostname, config in topology.devices.items():
-            if config.bgp_asn:
-                bgp_devices[hostname] = config.bgp_asn
-        
         if len(bgp_devices) > 1:
             asns = list(bgp_devices.values())
             if len(set(asns)) > 1:
@@ -262,38 +262,31 @@ class NetworkValidator:
                     recommendation="Verify BGP ASN configuration for external BGP sessions"
                 ))
     
-    def _validate_performance_configurations(self, topology: NetworkTopology):
+    def _validate_performance_configurations(self, topology: NetworkTopology, interface_rows: List[tuple]):
         """Validate performance-related configurations"""
         self.logger.info("Validating performance configurations...")
         
         # Check for MTU mismatches
-        mtu_by_subnet = {}
-        for hostname, config in topology.devices.items():
-            for interface in config.interfaces:
-                if interface.ip_address and interface.subnet_mask and interface.mtu:
-                    try:
-                        network = ipaddress.IPv4Network(
-                            f"{interface.ip_address}/{interface.subnet_mask}", 
-                            strict=False
-                        )
-                        network_key = str(network)
-                        
-                        if network_key not in mtu_by_subnet:
-                            mtu_by_subnet[network_key] = []
-                        
-                        mtu_by_subnet[network_key].append({
-                            'device': hostname,
-                            'interface': interface.name,
-                            'mtu': interface.mtu
-                        })
-                    except ValueError:
-                        continue
+        mtu_by_subnet = defaultdict(list)
+        for hostname, interface_name, ip_address, subnet_mask, _, mtu in interface_rows:
+            if ip_address and subnet_mask and mtu:
+                try:
+                    network_key = parse_network_int(ip_address, subnet_mask)
+                    
+                    mtu_by_subnet[network_key].append({
+                        'device': hostname,
+                        'interface': interface_name,
+                        'mtu': mtu
+                    })
+                except ValueError:
+                    continue
         
         # Check for MTU inconsistencies in same subnet
-        for subnet, interfaces in mtu_by_subnet.items():
+        for (network_int, prefixlen), interfaces in mtu_by_subnet.items():
             if len(interfaces) > 1:
                 mtus = [intf['mtu'] for intf in interfaces]
                 if len(set(mtus)) > 1:
+                    subnet = f"{ipaddress.IPv4Address(network_int)}/{prefixlen}"
                     self.issues.append(ValidationIssue(
                         severity='warning',
                         category='performance',
@@ -314,10 +307,12 @@ class NetworkValidator:
                 severity='warning',
                 category='performance',
                 message=f"Low bandwidth links detected: {len(low_bandwidth_links)} links < 100 Mbps",
-                affected_devices=list(set([link.source_device for link in low_bandwidth_links] + 
-                                        [link.target_device for link in low_bandwidth_links])),
-                affected_interfaces=list(set([link.source_interface for link in low_bandwidth_links] + 
-                                           [link.target_interface for link in low_bandwidth_links])),
+                affected_devices=list(dict.fromkeys(
+                    device for link in low_bandwidth_links for device in (link.source_device, link.target_device)
+                )),
+                affected_interfaces=list(dict.fromkeys(
+                    interface for link in low_bandwidth_links for interface in (link.source_interface, link.target_interface)
+                )),
                 recommendation="Consider upgrading low-bandwidth links for better performance"
             ))
     
@@ -377,7 +372,7 @@ class NetworkValidator:
             ))
         
         # Check for isolated devices
-        isolated_nodes = [node for node in graph.nodes() if graph.degree(node) == 0]
+        isolated_nodes = [node for node, degree in graph.degree() if degree == 0]
         if isolated_nodes:
             self.issues.append(ValidationIssue(
                 severity='error',
@@ -388,29 +383,26 @@ class NetworkValidator:
                 recommendation="Connect isolated devices to the network"
             ))
         
-        # Check for redundant links
-        redundant_links = []
-        for link in topology.links:
-            # Check if there are multiple paths between source and target
-            source = link.source_device
-            target = link.target_device
-            
-            # Remove this link temporarily to check for alternative paths
-            graph_temp = graph.copy()
-            graph_temp.remove_edge(source, target)
-            
-            if nx.has_path(graph_temp, source, target):
-                redundant_links.append(link)
+        # Check for redundant links: a link has a backup path unless it is a bridge,
+        # and one DFS finds every bridge instead of a copy-and-search per link
+        bridges = set(nx.bridges(graph))
+        redundant_links = [
+            link for link in topology.links
+            if (link.source_device, link.target_device) not in bridges
+            and (link.target_device, link.source_device) not in bridges
+        ]
         
         if redundant_links:
             self.issues.append(ValidationIssue(
                 severity='info',
                 category='redundancy',
                 message=f"Redundant links detected: {len(redundant_links)} links provide backup paths",
-                affected_devices=list(set([link.source_device for link in redundant_links] + 
-                                        [link.target_device for link in redundant_links])),
-                affected_interfaces=list(set([link.source_interface for link in redundant_links] + 
-                                           [link.target_interface for link in redundant_links])),
+                affected_devices=list(dict.fromkeys(
+                    device for link in redundant_links for device in (link.source_device, link.target_device)
+                )),
+                affected_interfaces=list(dict.fromkeys(
+                    interface for link in redundant_links for interface in (link.source_interface, link.target_interface)
+                )),
                 recommendation="Consider implementing load balancing across redundant links"
             ))
     
@@ -471,18 +463,8 @@ class NetworkValidator:
     
     def _is_valid_subnet_mask(self, mask_int: int) -> bool:
         """Check if an integer represents a valid subnet mask"""
-        # Convert to binary and check if it's a valid subnet mask
-        binary = bin(mask_int)[2:].zfill(32)
-        
-        # Check if it's all 1s followed by all 0s
-        found_zero = False
-        for bit in binary:
-            if bit == '0':
-                found_zero = True
-            elif found_zero and bit == '1':
-                return False
-        
-        return True
+        # All 1s followed by all 0s, i.e. it has a prefix length
+        return mask_prefix_length(mask_int) is not None
     
     def export_validation_report(self, output_file: str):
         """Export validation results to a report file"""
@@ -520,14 +502,13 @@ class NetworkValidator:
         }
         
         # Calculate statistics
+        issues_by_severity = defaultdict(int)
+        issues_by_category = defaultdict(int)
         for issue in self.issues:
-            if issue.severity not in report['summary']['issues_by_severity']:
-                report['summary']['issues_by_severity'][issue.severity] = 0
-            report['summary']['issues_by_severity'][issue.severity] += 1
-            
-            if issue.category not in report['summary']['issues_by_category']:
-                report['summary']['issues_by_category'][issue.category] = 0
-            report['summary']['issues_by_category'][issue.category] += 1
+            issues_by_severity[issue.severity] += 1
+            issues_by_category[issue.category] += 1
+        report['summary']['issues_by_severity'] = dict(issues_by_severity)
+        report['summary']['issues_by_category'] = dict(issues_by_category)
         
         with open(output_file, 'w') as f:
             json.dump(report, f, indent=2)
@@ -0,0 +1,39 @@
+"""Regression tests for ConfigParser"""
+from core.config_parser import ConfigParser
+
+
+def _parse_interface(body: str):
+    config = ConfigParser().parse_config_text(f"hostname R1\ninterface GigabitEthernet0/0\n{body}!\n")
+    return config.interfaces[0]
+
+
+def test_no_shutdown_is_not_shutdown():
+    assert _parse_interface(" ip address 10.0.0.1 255.255.255.0\n no shutdown\n").shutdown is False
+
+
+def test_shutdown_is_shutdown():
+    assert _parse_interface(" ip address 10.0.0.1 255.255.255.0\n shutdown\n").shutdown is True
+
+
+def test_last_shutdown_statement_wins():
+    assert _parse_interface(" shutdown\n no shutdown\n").shutdown is False
+    assert _parse_interface(" no shutdown\n shutdown\n").shutdown is True
+
+
+def _mtu_issues(*mtus):
+    interfaces = "".join(
+        f"interface GigabitEthernet0/{index}\n mtu {mtu}\n!\n" for index, mtu in enumerate(mtus)
+    )
+    parser = ConfigParser()
+    config = parser.parse_config_text(f"hostname R1\n{interfaces}")
+    return [issue for issue in parser.validate_config(config) if 'MTU' in issue]
+
+
+def test_matching_mtus_are_not_a_mismatch():
+    assert _mtu_issues(1500, 1500, 1500) == []
+
+
+def test_different_mtus_report_one_mismatch():
+    assert _mtu_issues(1500, 9000, 1500) == [
+        "MTU mismatch across interfaces: 1500: GigabitEthernet0/0, GigabitEthernet0/2; 9000: GigabitEthernet0/1"
+    ]
@@ -0,0 +1,50 @@
+"""Regression tests for NetworkDevice scheduling on the shared event loop"""
+import time
+
+import pytest
+
+from core import device as device_module
+from core.device import DeviceType, NetworkDevice
+
+
+def _wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+@pytest.fixture
+def idle_device(monkeypatch):
+    """A started router whose periodic tasks are far enough away that it sleeps until woken"""
+    for interval in ('_UPTIME_INTERVAL', '_KEEPALIVE_INTERVAL', '_OSPF_HELLO_INTERVAL'):
+        monkeypatch.setattr(device_module, interval, 60.0)
+    device = NetworkDevice('R1', DeviceType.ROUTER, {'interfaces': []})
+    device.start()
+    assert _wait_until(lambda: device._idle)
+    yield device
+    device.stop()
+    device.join(timeout=1.0)
+
+
+def test_message_to_idle_device_is_processed_promptly(idle_device):
+    sent = time.monotonic()
+    idle_device.send_message({'type': 'routing_update', 'route': {'destination': '10.0.0.0/24', 'next_hop': 'R2'}})
+    assert _wait_until(lambda: idle_device.routing_table, timeout=1.0)
+    assert time.monotonic() - sent < 1.0
+    assert idle_device.statistics.packets_received == 1
+
+
+def test_stop_wakes_idle_device_and_join_returns(idle_device):
+    stopped = time.monotonic()
+    idle_device.stop()
+    idle_device.join(timeout=5.0)
+    assert not idle_device.is_alive()
+    assert time.monotonic() - stopped < 1.0
+
+
+def test_second_start_raises(idle_device):
+    with pytest.raises(RuntimeError):
+        idle_device.start()
@@ -0,0 +1,30 @@
+"""Regression tests for NetworkSimulator"""
+from core.config_parser import ConfigParser
+from core.simulator import NetworkSimulator
+from core.topology_generator import TopologyGenerator
+
+
+def _simulator():
+    parser = ConfigParser()
+    configs = {
+        hostname: parser.parse_config_text(
+            f"hostname {hostname}\n"
+            f"interface GigabitEthernet0/0\n ip address 10.0.0.{index} 255.255.255.0\n no shutdown\n!\n"
+            "router ospf 1\n"
+        )
+        for index, hostname in enumerate(['R1', 'R2'], start=1)
+    }
+    return NetworkSimulator(TopologyGenerator().generate_topology(configs))
+
+
+def test_devices_start_offline():
+    statistics = _simulator().statistics
+    assert (statistics['devices_online'], statistics['devices_offline']) == (0, 2)
+
+
+def test_stop_moves_every_device_offline():
+    simulator = _simulator()
+    simulator.start_simulation()
+    simulator.stop_simulation()
+    statistics = simulator.statistics
+    assert (statistics['devices_online'], statistics['devices_offline']) == (0, 2)
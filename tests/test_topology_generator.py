@@ -0,0 +1,151 @@
+"""Regression tests for TopologyGenerator"""
+import random
+
+import networkx as nx
+import pytest
+
+from core.config_parser import ConfigParser
+from core import topology_generator
+from core.topology_generator import NetworkLink, NetworkTopology, TopologyGenerator
+
+
+def _generator(*links):
+    """Generator over routers joined by /30 links given as (device, device) pairs"""
+    interfaces = {}
+    for index, (device1, device2) in enumerate(links):
+        for offset, device in enumerate((device1, device2), start=1):
+            interfaces.setdefault(device, []).append(
+                f"interface GigabitEthernet0/{len(interfaces.get(device, []))}\n"
+                f" ip address 10.0.{index}.{offset} 255.255.255.252\n no shutdown\n!\n"
+            )
+    parser = ConfigParser()
+    configs = {
+        device: parser.parse_config_text(f"hostname {device}\n" + "".join(blocks))
+        for device, blocks in interfaces.items()
+    }
+    generator = TopologyGenerator()
+    generator.generate_topology(configs)
+    return generator
+
+
+def test_analysis_result_can_be_modified_by_callers():
+    generator = _generator(('R1', 'R2'), ('R2', 'R3'))
+    generator.analyze_topology()['potential_issues'].append('caller note')
+    assert 'caller note' not in generator.analyze_topology()['potential_issues']
+
+
+def test_precomputed_paths_match_on_demand_paths():
+    links = [('R1', 'R2'), ('R1', 'R3'), ('R2', 'R4'), ('R2', 'R3'), ('R4', 'R5'), ('R3', 'R5')]
+    on_demand = _generator(*links)
+    precomputed = _generator(*links)
+    precomputed.precompute_paths('R2')
+    for target in ('R1', 'R3', 'R4', 'R5'):
+        assert precomputed.get_shortest_path('R2', target) == on_demand.get_shortest_path('R2', target)
+
+
+def test_path_cache_keeps_the_most_recently_used_sources(monkeypatch):
+    monkeypatch.setattr(topology_generator, '_PATH_TREE_CACHE_SIZE', 2)
+    generator = _generator(('R1', 'R2'), ('R2', 'R3'), ('R3', 'R4'))
+    for source in ('R1', 'R2', 'R1', 'R3', 'R4'):
+        generator.get_shortest_path(source, 'R4')
+    assert list(generator._path_trees) == ['R3', 'R4']
+    assert generator.get_shortest_path('R1', 'R4') == ['R1', 'R2', 'R3', 'R4']
+
+
+def test_topology_accepts_a_graph_argument():
+    graph = nx.Graph([('R1', 'R2'), ('R2', 'R3')])
+    topology = NetworkTopology(devices={}, links=[], graph=graph, subnets={}, vlans={}, routing_domains={})
+    assert topology.graph is graph
+    assert list(topology.adjacency['R2']) == ['R1', 'R3']
+
+
+def test_assigned_graph_replaces_derived_connectivity():
+    generator = _generator(('R1', 'R2'), ('R2', 'R3'))
+    assert generator.get_device_neighbors('R1') == ['R2']
+    generator.topology.graph = nx.Graph([('R1', 'R3')])
+    assert generator.get_device_neighbors('R1') == ['R3']
+    assert generator.get_shortest_path('R1', 'R3') == ['R1', 'R3']
+
+
+def test_bandwidth_analysis_follows_appended_links():
+    generator = _generator(('R1', 'R2'), ('R2', 'R3'))
+    generator.analyze_topology()
+    generator.topology.links.append(NetworkLink('R1', 'Serial0/0', 'R3', 'Serial0/0', 10, 5.0, 0.998, 'serial'))
+    analysis = generator.analyze_topology()
+    assert analysis['total_links'] == 3
+    bandwidth = analysis['bandwidth_analysis']
+    assert bandwidth['total_bandwidth_mbps'] == sum(link.bandwidth for link in generator.topology.links)
+    assert sum(bandwidth['bandwidth_distribution'].values()) == 3
+    assert bandwidth['bandwidth_distribution']['low'] == 1
+
+
+def _indexed(graph):
+    """Node list and neighbor ids of a NetworkX graph, as NetworkTopology indexes them"""
+    nodes = list(graph)
+    ids = {node: i for i, node in enumerate(nodes)}
+    return nodes, [[ids[neighbor] for neighbor in graph.adj[node]] for node in nodes]
+
+
+def _random_graph(seed):
+    rng = random.Random(seed)
+    graph = nx.Graph()
+    graph.add_nodes_from(range(rng.randint(1, 15)))
+    for _ in range(rng.randint(0, 25)):
+        graph.add_edge(rng.randrange(len(graph)), rng.randrange(len(graph)))
+    graph.remove_edges_from(list(nx.selfloop_edges(graph)))
+    return graph
+
+
+@pytest.mark.parametrize('graph', [
+    nx.Graph(),
+    nx.empty_graph(1),
+    nx.star_graph(3),  # cut vertex at the DFS root
+    nx.path_graph(5),
+    nx.cycle_graph(5),
+    nx.disjoint_union_all([nx.path_graph(3), nx.cycle_graph(4), nx.empty_graph(2)]),
+] + [_random_graph(seed) for seed in range(200)])
+def test_scan_connectivity_matches_networkx(graph):
+    points, components = topology_generator._scan_connectivity(*_indexed(graph))
+    assert points == list(nx.articulation_points(graph))
+    assert components == nx.number_connected_components(graph)
+
+
+def _tree_paths(graph, source):
+    """Paths to every node reachable from source, read from the integer-id BFS tree"""
+    nodes, neighbors = _indexed(graph)
+    parents = topology_generator._bfs_parents(neighbors, nodes.index(source))
+    paths = {}
+    for target, parent in enumerate(parents):
+        if parent == topology_generator._UNREACHED:
+            continue
+        path = []
+        node = target
+        while node != -1:
+            path.append(nodes[node])
+            node = parents[node]
+        paths[nodes[target]] = path[::-1]
+    return paths
+
+
+@pytest.mark.parametrize('graph', [
+    nx.empty_graph(1),
+    nx.cycle_graph(4),  # two equal-length paths to the opposite node
+    nx.complete_bipartite_graph(2, 3),
+    nx.disjoint_union(nx.path_graph(3), nx.path_graph(2)),  # unreachable pairs
+] + [_random_graph(seed) for seed in range(100)])
+def test_bfs_paths_match_networkx(graph):
+    for source in graph:
+        paths = _tree_paths(graph, source)
+        assert paths == nx.shortest_path(graph, source)
+        assert paths[source] == [source]
+
+
+def test_shortest_path_breaks_ties_like_networkx():
+    generator = _generator(('R1', 'R2'), ('R1', 'R3'), ('R2', 'R4'), ('R3', 'R4'))
+    assert generator.get_shortest_path('R1', 'R4') == nx.shortest_path(generator.topology.graph, 'R1')['R4']
+    assert generator.get_shortest_path('R1', 'R1') == ['R1']
+
+
+def test_shortest_path_between_disconnected_devices_is_none():
+    generator = _generator(('R1', 'R2'), ('R3', 'R4'))
+    assert generator.get_shortest_path('R1', 'R4') is None
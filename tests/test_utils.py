@@ -0,0 +1,105 @@
+"""Regression tests for core.utils"""
+import ipaddress
+import os
+import random
+
+import pytest
+
+from core.utils import FileUtils, NetworkAnalysis, NetworkUtils
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write("hostname R1\n")
+
+
+def test_find_config_files_skips_non_matching_files(tmp_path):
+    for name in ['notes.txt', 'R1/config.dump', 'R2/readme.md', 'R2/config.dump']:
+        _touch(os.path.join(tmp_path, name))
+    
+    found = FileUtils.find_config_files(str(tmp_path))
+    assert sorted(os.path.relpath(path, tmp_path) for path in found) == [
+        os.path.join('R1', 'config.dump'),
+        os.path.join('R2', 'config.dump'),
+    ]
+
+
+def test_find_config_files_matches_glob_pattern(tmp_path):
+    for name in ['R1.cfg', 'R2.txt']:
+        _touch(os.path.join(tmp_path, name))
+    
+    found = FileUtils.find_config_files(str(tmp_path), pattern="*.cfg")
+    assert [os.path.basename(path) for path in found] == ['R1.cfg']
+
+
+def test_is_valid_ip_rejects_unhashable_input():
+    assert NetworkUtils.is_valid_ip(['1.1.1.1']) is False
+    assert NetworkUtils.is_valid_ip('1.1.1.1') is True
+
+
+def test_estimate_latency_batch_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        NetworkUtils.estimate_latency_batch([10.0, 20.0], ['fiber'])
+
+
+def test_batch_utilization_and_efficiency_reject_mismatched_lengths():
+    with pytest.raises(ValueError):
+        NetworkUtils.calculate_bandwidth_utilizations([1, 2, 3], [10])
+    with pytest.raises(ValueError):
+        NetworkAnalysis.calculate_network_efficiencies([3, 4], [2])
+
+
+def _subnet(cidr):
+    ip, _, prefix = cidr.partition('/')
+    return {'ip': ip, 'mask': str(ipaddress.IPv4Network(f"0.0.0.0/{prefix}").netmask)}
+
+
+def _overlap_pairs(subnets):
+    """(index, index, overlap type) of each reported overlap"""
+    # Identical blocks compare equal, so look entries up by identity
+    index = {id(subnet): i for i, subnet in enumerate(subnets)}
+    return [
+        (index[id(overlap['subnet1'])], index[id(overlap['subnet2'])], overlap['overlap_type'])
+        for overlap in NetworkAnalysis.analyze_subnet_overlap(subnets)
+    ]
+
+
+def test_subnet_overlap_reports_nested_and_identical_blocks():
+    subnets = [_subnet('10.0.1.0/24'), _subnet('10.0.0.0/16'), _subnet('192.168.0.0/24'), _subnet('10.0.1.0/24')]
+    assert _overlap_pairs(subnets) == [(0, 1, 'partial'), (0, 3, 'full'), (1, 3, 'partial')]
+
+
+def test_subnet_overlap_reports_every_pair_of_three_nested_blocks():
+    subnets = [_subnet('10.1.2.0/24'), _subnet('10.0.0.0/8'), _subnet('10.1.0.0/16')]
+    assert _overlap_pairs(subnets) == [(0, 1, 'partial'), (0, 2, 'partial'), (1, 2, 'partial')]
+
+
+def test_subnet_overlap_skips_invalid_masks():
+    subnets = [_subnet('10.0.0.0/24'), {'ip': '10.0.0.1', 'mask': '255.0.255.0'}, _subnet('10.0.0.0/25')]
+    assert _overlap_pairs(subnets) == [(0, 2, 'partial')]
+
+
+def test_subnet_overlap_matches_pairwise_scan():
+    rng = random.Random(0)
+    for _ in range(50):
+        subnets = [
+            {'ip': f"10.{rng.randrange(4)}.{rng.randrange(4)}.{rng.randrange(256)}", 'mask': rng.choice(
+                ['255.0.0.0', '255.255.0.0', '255.255.252.0', '255.255.255.0', '255.255.255.128', '255.255.0.255'])}
+            for _ in range(rng.randint(0, 12))
+        ]
+        expected = []
+        for i, subnet1 in enumerate(subnets):
+            for j in range(i + 1, len(subnets)):
+                try:
+                    net1 = ipaddress.IPv4Network(f"{subnet1['ip']}/{subnet1['mask']}", strict=False)
+                    net2 = ipaddress.IPv4Network(f"{subnets[j]['ip']}/{subnets[j]['mask']}", strict=False)
+                except ValueError:
+                    continue
+                if net1.overlaps(net2):
+                    expected.append((subnet1, subnets[j], 'full' if net1 == net2 else 'partial'))
+        actual = [
+            (overlap['subnet1'], overlap['subnet2'], overlap['overlap_type'])
+            for overlap in NetworkAnalysis.analyze_subnet_overlap(subnets)
+        ]
+        assert actual == expected
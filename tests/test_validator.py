@@ -0,0 +1,40 @@
+"""Regression tests for NetworkValidator"""
+from core.topology_generator import NetworkLink, NetworkTopology
+from core.validator import NetworkValidator
+
+
+def _redundancy_issues(*links):
+    """Redundancy issues for devices joined by links given as (device, device) pairs"""
+    devices = {device: None for link in links for device in link}
+    topology = NetworkTopology(
+        devices=devices,
+        links=[NetworkLink(device1, 'Gi0/0', device2, 'Gi0/0', 1000, 0.1, 0.9999, 'gigabit_ethernet')
+               for device1, device2 in links],
+        graph=None,
+        subnets={},
+        vlans={},
+        routing_domains={}
+    )
+    validator = NetworkValidator()
+    validator._validate_network_redundancy(topology)
+    return validator.issues
+
+
+def _redundant_link_issues(*links):
+    return [issue for issue in _redundancy_issues(*links) if issue.message.startswith("Redundant links")]
+
+
+def test_triangle_links_are_redundant():
+    issues = _redundant_link_issues(('R1', 'R2'), ('R2', 'R3'), ('R3', 'R1'))
+    assert [issue.message for issue in issues] == ["Redundant links detected: 3 links provide backup paths"]
+    assert sorted(issues[0].affected_devices) == ['R1', 'R2', 'R3']
+
+
+def test_chain_links_are_not_redundant():
+    assert _redundant_link_issues(('R1', 'R2'), ('R2', 'R3'), ('R3', 'R4')) == []
+
+
+def test_only_links_on_a_cycle_are_redundant():
+    issues = _redundant_link_issues(('R1', 'R2'), ('R2', 'R3'), ('R3', 'R1'), ('R3', 'R4'))
+    assert [issue.message for issue in issues] == ["Redundant links detected: 3 links provide backup paths"]
+    assert sorted(issues[0].affected_devices) == ['R1', 'R2', 'R3']
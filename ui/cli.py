@@ -415,7 +415,7 @@ Examples:
         if not self.simulator:
             return
         
-        status = self.simulator.get_network_status()
+        status = self.simulator.get_network_status(include_devices=False)
         print(f"\rSimulation Time: {status['simulation_time']:.1f}s | "
               f"Devices Online: {status['statistics']['devices_online']} | "
               f"Active Faults: {status['active_faults']}", end='', flush=True)